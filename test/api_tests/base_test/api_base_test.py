@@ -0,0 +1,14 @@
+import pytest
+from apis.admin_api import AdminApi
+from ui_tests.base_test.base_verifier import BaseVerifier
+
+
+class ApiBaseTest:
+    admin_api: AdminApi
+    verifier: BaseVerifier
+
+    @pytest.fixture(autouse=True, scope='function')
+    def init_admin_api(self, admin_api):
+        self.admin_api = admin_api
+        self.verifier = BaseVerifier()
+        yield
@@ -0,0 +1,16 @@
+import pytest
+from apis.admin_api import AdminApi
+from mock_server.kong_admin import KongAdminMockServer
+
+
+@pytest.fixture(scope='session')
+def admin_mock_server():
+    with KongAdminMockServer() as server:
+        yield server
+
+
+@pytest.fixture(scope='function')
+def admin_api(admin_mock_server):
+    with AdminApi(admin_mock_server.url) as admin_api:
+        yield admin_api
+        admin_api.purge()
@@ -0,0 +1,41 @@
+from collections import Counter
+from itertools import islice
+from pages.page_gateway_service import ModelAddGatewayService
+from utils.data_generator import DataGenerator
+from utils.random_util import RandomUtil
+from api_tests.base_test.api_base_test import ApiBaseTest
+
+
+class TestDataGenerator(ApiBaseTest):
+
+    def test_same_seed_same_data(self):
+        def generate():
+            # names are unique within the run, the rest of the data is reproduced by the seed
+            return [{key: value.replace(service.name, "") if isinstance(value, str) else value
+                     for key, value in service.items()} for service in DataGenerator(seed=7).gateway_services(20)]
+
+        self.verifier.verify_equals(generate(), generate())
+
+    def test_gateway_services_follow_the_form(self):
+        for service in DataGenerator(seed=7).gateway_services(200):
+            # a generated service is valid input of the form
+            ModelAddGatewayService.from_dict(dict(service))
+
+    def test_names_are_unique(self):
+        names = Counter(service.name for service in islice(DataGenerator().gateway_services(), 100_000))
+        self.verifier.verify_equals(names.most_common(1)[0][1], 1)
+
+    def test_gateway_services_are_generated_lazily(self):
+        services = DataGenerator().gateway_services(10 ** 12)
+        first = next(iter(services))
+        # only the first service drew a name, the next name follows it
+        next_name = RandomUtil.unique_name()
+        self.verifier.verify_equals(int(next_name.rsplit("-", 1)[1]), int(first.name.rsplit("-", 1)[1]) + 1)
+
+    def test_admin_api_accepts_generated_entities(self):
+        generator = DataGenerator(seed=7)
+        services = self.admin_api.gateway_services.create_many(
+            service.to_admin_payload() for service in generator.gateway_services(50))
+        routes = self.admin_api.routes.create_many(generator.routes(services))
+        self.verifier.verify_equals(self.admin_api.gateway_services.count(), 50)
+        self.verifier.verify_equals(len(routes), 50)
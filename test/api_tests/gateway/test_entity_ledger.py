@@ -0,0 +1,31 @@
+from utils.entity_ledger import EntityLedger
+from api_tests.base_test.api_base_test import ApiBaseTest
+
+
+class TestEntityLedger(ApiBaseTest):
+
+    def test_purge_deletes_recorded_entities_only(self):
+        kept = self.admin_api.gateway_services.new_gateway_service("kept")
+        ledger = EntityLedger()
+        service = self.admin_api.gateway_services.new_gateway_service("kim")
+        ledger.record("services", service)
+        ledger.record("routes", self.admin_api.routes.new_route("route", service["id"]))
+        self.verifier.verify_equals(ledger.purge(self.admin_api), 2)
+        self.verifier.verify_equals(len(ledger), 0)
+        self.verifier.verify_equals(self.admin_api.gateway_services.ids(), [kept["id"]])
+        self.verifier.verify_true(self.admin_api.routes.is_empty())
+
+    def test_purge_skips_entities_deleted_by_the_test(self):
+        ledger = EntityLedger()
+        service = self.admin_api.gateway_services.new_gateway_service("kim")
+        ledger.record("services", service)
+        self.admin_api.gateway_services.delete(service["id"])
+        self.verifier.verify_equals(ledger.purge(self.admin_api), 1)
+
+    def test_purge_leaks_against_baseline(self):
+        kept = self.admin_api.gateway_services.new_gateway_service("kept")
+        baseline = EntityLedger.snapshot(self.admin_api)
+        leaked = self.admin_api.gateway_services.new_gateway_service("leaked")
+        self.admin_api.routes.new_route("route", leaked["id"])
+        self.verifier.verify_equals(EntityLedger.purge_leaks(self.admin_api, baseline), 2)
+        self.verifier.verify_equals(self.admin_api.gateway_services.ids(), [kept["id"]])
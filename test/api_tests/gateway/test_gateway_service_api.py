@@ -0,0 +1,77 @@
+import pytest
+from apis.base_api import AdminApiError
+from api_tests.base_test.api_base_test import ApiBaseTest
+
+
+class TestGatewayServiceApi(ApiBaseTest):
+
+    @pytest.mark.smoke
+    def test_new_gateway_service(self):
+        service = self.admin_api.gateway_services.new_gateway_service("kim", url="http://kim.org")
+        self.verifier.verify_equals(self.admin_api.gateway_services.get(service["id"])["name"], "kim")
+        self.verifier.verify_equals(self.admin_api.gateway_services.count(), 1)
+
+    def test_list_pages_through_offset(self):
+        self.admin_api.gateway_services.create_many({"name": f"kim{i}", "url": "http://kim.org"} for i in range(5))
+        data, offset = self.admin_api.gateway_services.list(size=2)
+        self.verifier.verify_equals(len(data), 2)
+        self.verifier.verify_true(offset, "a next page offset is returned")
+        names = [service["name"] for service in self.admin_api.gateway_services.iter_all(size=2)]
+        self.verifier.verify_equals(sorted(names), [f"kim{i}" for i in range(5)])
+
+    def test_purge(self):
+        services = self.admin_api.gateway_services.create_many({"name": f"kim{i}", "url": "http://kim.org"} for i in range(3))
+        for i, service in enumerate(services):
+            self.admin_api.routes.new_route(f"route{i}", service["id"])
+        self.admin_api.purge()
+        self.verifier.verify_equals(self.admin_api.routes.count(), 0)
+        self.verifier.verify_equals(self.admin_api.gateway_services.count(), 0)
+
+    def test_get_missing_gateway_service(self):
+        self.verifier.verify_openapi_call_failed(
+            self.admin_api.gateway_services.get, func_args=["missing"],
+            expected_exception=AdminApiError, expected_status=404,
+            msg="getting a missing gateway service should fail")
+
+    def test_delete_all_in_bulk(self):
+        self.admin_api.gateway_services.create_many(
+            {"name": f"kim{i}", "url": "http://kim.org"} for i in range(250))
+        self.verifier.verify_equals(self.admin_api.gateway_services.delete_all(), 250)
+        self.verifier.verify_true(self.admin_api.gateway_services.is_empty())
+
+    def test_new_gateway_service_with_duplicate_name(self):
+        self.admin_api.gateway_services.new_gateway_service("kim", url="http://kim.org")
+        self.verifier.verify_openapi_call_failed(
+            self.admin_api.gateway_services.new_gateway_service, func_args=["kim"],
+            expected_exception=AdminApiError, expected_status=409,
+            expected_msg="UNIQUE violation detected",
+            msg="creating a gateway service with a duplicate name should fail")
+
+    def test_update_gateway_service(self):
+        service = self.admin_api.gateway_services.new_gateway_service("kim", url="http://kim.org")
+        updated = self.admin_api.gateway_services.update(service["id"], {"url": "https://kim.org:8443/api"})
+        self.verifier.verify_equals(
+            [updated[key] for key in ("name", "protocol", "host", "port", "path")],
+            ["kim", "https", "kim.org", 8443, "/api"])
+        self.admin_api.gateway_services.upsert("kim", {"url": "http://kim.org"})
+        self.verifier.verify_equals(self.admin_api.gateway_services.get(service["id"])["protocol"], "http")
+
+    def test_delete_gateway_service_with_routes(self):
+        service = self.admin_api.gateway_services.new_gateway_service("kim", url="http://kim.org")
+        self.admin_api.routes.new_route("kim", service["id"])
+        self.verifier.verify_openapi_call_failed(
+            self.admin_api.gateway_services.delete, func_args=[service["id"]],
+            expected_exception=AdminApiError, expected_status=400,
+            expected_msg="an existing 'routes' entity references this 'services' entity",
+            msg="deleting a gateway service referenced by routes should fail")
+
+    def test_failed_request_keeps_the_connection_usable(self):
+        services = self.admin_api.gateway_services
+        # the stand-in rejects both before reading their body, the next request reuses the connection
+        self.verifier.verify_openapi_call_failed(
+            services.request, func_args=["POST", f"{services.endpoint}/kim"], func_kwargs={"json": {"name": "kim"}},
+            expected_exception=AdminApiError, expected_status=404, msg="POST to a service should fail")
+        self.verifier.verify_openapi_call_failed(
+            self.admin_api.routes.create, func_args=[{"name": "kim", "paths": ["/kim"], "service": 5}],
+            expected_exception=AdminApiError, expected_status=500, msg="an unexpected error should be answered")
+        self.verifier.verify_equals(services.count(), 0)
@@ -0,0 +1,32 @@
+import os
+import pytest
+from pages.page_gateway_service import ModelAddGatewayService
+from utils.yaml_util import YamlUtil
+from ui_tests.base_test.base_verifier import BaseVerifier
+
+data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "ui_tests", "gateway", "data")
+
+
+class TestGatewayServiceData:
+    verifier = BaseVerifier()
+
+    def test_read_records(self):
+        records = YamlUtil.read_records(os.path.join(data_dir, "new_gateway_service.yaml"), ModelAddGatewayService)
+        self.verifier.verify_equals([record.name for record in records], ["url", "separate_elements"])
+        self.verifier.verify_equals(dict(records[1])["port"], "8080")
+        # records are validated once and shared by the tests reading the same file
+        self.verifier.verify_true(
+            YamlUtil.read_records(os.path.join(data_dir, "new_gateway_service.yaml"), ModelAddGatewayService)
+            is records)
+
+    @pytest.mark.parametrize("data", [
+        {"name": "kim"},
+        {"name": "kim", "url": "http://kim.org", "protocol": "http"},
+        {"name": "kim", "protocol": "ftp", "host": "kim.org"},
+        {"name": "kim", "url": "http://kim.org", "port": "eighty"},
+        {"name": "kim", "url": "http://kim.org", "timeout": "1000"},
+    ])
+    def test_invalid_record(self, data):
+        self.verifier.verify_openapi_call_failed(
+            ModelAddGatewayService.from_dict, func_args=[data], expected_exception=ValueError,
+            msg=f"{data} should be rejected")
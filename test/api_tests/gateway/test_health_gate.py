@@ -0,0 +1,30 @@
+import socket
+from mock_server.kong_admin import KongAdminMockServer
+from mock_server.upstream import UpstreamMockServer
+from utils.health_gate import HealthGate, HealthGateError, kong_status_check, manager_check, postgres_check
+from ui_tests.base_test.base_verifier import BaseVerifier
+
+
+def _closed_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestHealthGate:
+    verifier = BaseVerifier()
+
+    def test_services_up(self):
+        with KongAdminMockServer() as admin, UpstreamMockServer() as manager:
+            outcomes = HealthGate(timeout=5).add("admin_api", kong_status_check(admin.url)) \
+                .add("manager", manager_check(manager.url)).wait()
+        self.verifier.verify_equals(sorted(outcomes), ["admin_api", "manager"])
+
+    def test_service_down(self):
+        with KongAdminMockServer() as admin:
+            gate = HealthGate(timeout=0.5, initial_delay=0.05) \
+                .add("admin_api", kong_status_check(admin.url)) \
+                .add("postgres", postgres_check(f"127.0.0.1:{_closed_port()}", timeout=0.1))
+            self.verifier.verify_openapi_call_failed(
+                gate.wait, expected_exception=HealthGateError, expected_msg="postgres: DOWN",
+                msg="the gate should fail while postgres is down")
@@ -0,0 +1,33 @@
+import asyncio
+import pytest
+from mock_server.upstream import UpstreamMockServer
+from utils.load_generator import ProxyLoadGenerator
+from ui_tests.base_test.base_verifier import BaseVerifier
+
+
+@pytest.fixture(scope='module')
+def upstream():
+    # the upstream stands in for the proxy, the load generator only sees HTTP
+    with UpstreamMockServer() as upstream:
+        yield upstream
+
+
+class TestLoadGenerator:
+    verifier = BaseVerifier()
+
+    def test_load_at_target_rate(self, upstream):
+        report = ProxyLoadGenerator(upstream.url, rps=200, duration=1).run_sync({"kim": "/kim", "xie": "/xie"})
+        summary = report.summary()
+        self.verifier.verify_equals(sorted(summary), ["kim", "xie"])
+        self.verifier.verify_equals([summary[name]["count"] for name in summary], [100, 100])
+        self.verifier.verify_equals(report.violations(p99_ms=1000, min_throughput=50), [])
+
+    def test_budget_violations(self):
+        with UpstreamMockServer(delay_ms=20) as upstream:
+            report = ProxyLoadGenerator(upstream.url, rps=50, duration=0.5).run_sync({"kim": "/kim"})
+        self.verifier.verify_equals(len(report.violations(p99_ms=5)), 1)
+
+    def test_unreachable_proxy(self):
+        report = asyncio.run(ProxyLoadGenerator("http://127.0.0.1:9", rps=20, duration=0.5).run({"kim": "/kim"}))
+        self.verifier.verify_equals(report.route("kim")["errors"], 10)
+        self.verifier.verify_equals(report.violations(), ["kim: 10/10 requests failed"])
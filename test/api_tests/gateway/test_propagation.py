@@ -0,0 +1,23 @@
+import time
+from mock_server.upstream import UpstreamMockServer
+from utils.propagation import PropagationProbe
+from ui_tests.base_test.base_verifier import BaseVerifier
+
+
+class TestPropagationProbe:
+    verifier = BaseVerifier()
+
+    def test_wait_until_served(self):
+        with UpstreamMockServer() as upstream:
+            probe = PropagationProbe(upstream.url)
+            since = time.perf_counter()
+            latency = probe.wait_until_served("/kim", since)
+            probe.close()
+        self.verifier.verify_true(0 <= latency < 1000, f"served after {latency}ms")
+
+    def test_timeout(self):
+        probe = PropagationProbe("http://127.0.0.1:9", timeout=0.2)
+        self.verifier.verify_openapi_call_failed(
+            probe.wait_until_served, func_args=["/kim", time.perf_counter()], expected_exception=TimeoutError,
+            msg="a route never served should time out")
+        probe.close()
@@ -0,0 +1,44 @@
+from apis.base_api import AdminApiError
+from api_tests.base_test.api_base_test import ApiBaseTest
+
+
+class TestWorkspaceApi(ApiBaseTest):
+
+    def test_entities_are_isolated_per_workspace(self):
+        self.admin_api.workspaces.new_workspace("autotest-ws")
+        try:
+            workspace_api = self.admin_api.for_workspace("autotest-ws")
+            workspace_api.gateway_services.new_gateway_service("kim", url="http://kim.org")
+            self.verifier.verify_equals(workspace_api.gateway_services.count(), 1)
+            self.verifier.verify_equals(self.admin_api.gateway_services.count(), 0)
+        finally:
+            # Kong refuses to delete a workspace that still has entities
+            self.admin_api.for_workspace("autotest-ws").purge()
+            self.admin_api.workspaces.delete("autotest-ws")
+        self.verifier.verify_not_in("autotest-ws", [ws["name"] for ws in self.admin_api.workspaces.iter_all()])
+
+    def test_delete_workspace_with_entities(self):
+        self.admin_api.workspaces.new_workspace("autotest-ws")
+        workspace_api = self.admin_api.for_workspace("autotest-ws")
+        workspace_api.gateway_services.new_gateway_service("kim", url="http://kim.org")
+        try:
+            self.verifier.verify_openapi_call_failed(
+                self.admin_api.workspaces.delete, func_args=["autotest-ws"],
+                expected_exception=AdminApiError, expected_status=400,
+                msg="deleting a workspace with entities should fail")
+        finally:
+            workspace_api.purge()
+            self.admin_api.workspaces.delete("autotest-ws")
+
+    def test_update_workspace(self):
+        created = self.admin_api.workspaces.upsert("autotest-ws", {"comment": "created"})
+        try:
+            updated = self.admin_api.workspaces.update(
+                "autotest-ws", {"comment": "updated", "id": "not-the-id", "created_at": 0})
+            self.verifier.verify_equals(
+                [updated[key] for key in ("id", "created_at", "comment")],
+                [created["id"], created["created_at"], "updated"])
+            replaced = self.admin_api.workspaces.upsert("autotest-ws", {"comment": "replaced"})
+            self.verifier.verify_equals([replaced["id"], replaced["comment"]], [created["id"], "replaced"])
+        finally:
+            self.admin_api.workspaces.delete("autotest-ws")
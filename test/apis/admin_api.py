@@ -0,0 +1,62 @@
+from requests import Session
+from requests.adapters import HTTPAdapter
+from .api_gateway_service import GatewayServiceApi
+from .api_route import RouteApi
+from .api_workspace import WorkspaceApi
+
+
+class AdminApi:
+    """
+    Entry of the Kong Admin API client, all endpoints share one session so that connections are pooled
+    and kept alive across calls, it is used by fixtures to seed and purge entities without clicking through the UI
+    """
+
+    def __init__(self, admin_url, workspace_name="default", pool_size=16, session: Session = None):
+        self._admin_url = admin_url.rstrip("/")
+        self._workspace_name = workspace_name
+        self._pool_size = pool_size
+        if session is None:
+            session = Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self._session = session
+        self.workspaces = WorkspaceApi(self._session, self._admin_url, concurrency=pool_size)
+        self.gateway_services = GatewayServiceApi(self._session, self._admin_url, workspace_name, pool_size)
+        self.routes = RouteApi(self._session, self._admin_url, workspace_name, pool_size)
+
+    @property
+    def admin_url(self):
+        return self._admin_url
+
+    @property
+    def workspace_name(self):
+        return self._workspace_name
+
+    def for_workspace(self, workspace_name):
+        """
+        :return: a client of another workspace sharing the same connection pool
+        """
+        return AdminApi(self._admin_url, workspace_name, self._pool_size, session=self._session)
+
+    def purge(self):
+        """
+        Delete all routes and gateway services, routes go first as they reference services
+        """
+        self.routes.delete_all()
+        self.gateway_services.delete_all()
+
+    def purge_cache(self):
+        """
+        Purge the entity cache of Kong, e.g. after its database was changed behind its back
+        """
+        self.workspaces.request("DELETE", f"{self._admin_url}/cache")
+
+    def close(self):
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
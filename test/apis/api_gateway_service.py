@@ -0,0 +1,10 @@
+from .base_api import BaseApi
+
+
+class GatewayServiceApi(BaseApi):
+    _entity = "services"
+
+    def new_gateway_service(self, name, url="http://kim.org", **kwargs):
+        payload = {"name": name, "url": url}
+        payload.update({k: v for k, v in kwargs.items() if v is not None})
+        return self.create(payload)
@@ -0,0 +1,19 @@
+from .base_api import BaseApi
+
+
+class RouteApi(BaseApi):
+    _entity = "routes"
+
+    def new_route(self, name, service_id_or_name, paths=("/",), **kwargs):
+        service_key = "id" if self._looks_like_id(service_id_or_name) else "name"
+        payload = {
+            "name": name,
+            "paths": list(paths),
+            "service": {service_key: service_id_or_name}
+        }
+        payload.update({k: v for k, v in kwargs.items() if v is not None})
+        return self.create(payload)
+
+    @staticmethod
+    def _looks_like_id(value):
+        return len(value) == 36 and value.count("-") == 4
@@ -0,0 +1,15 @@
+from .base_api import BaseApi
+
+
+class WorkspaceApi(BaseApi):
+    _entity = "workspaces"
+
+    @property
+    def endpoint(self):
+        # workspaces are not scoped by a workspace themselves
+        return f"{self._admin_url}/{self._entity}"
+
+    def new_workspace(self, name, **kwargs):
+        payload = {"name": name}
+        payload.update({k: v for k, v in kwargs.items() if v is not None})
+        return self.create(payload)
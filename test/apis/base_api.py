@@ -0,0 +1,135 @@
+from concurrent.futures import ThreadPoolExecutor
+from requests import Session
+from utils.log_util import logger
+
+
+class AdminApiError(Exception):
+    """
+    Raised when the Kong Admin API answers with an error status, status and body are kept
+    so that BaseVerifier.verify_openapi_call_failed can check them
+    """
+
+    def __init__(self, method, url, status, body):
+        self.method = method
+        self.url = url
+        self.status = status
+        self.body = body
+        super().__init__(f"{method} {url} failed with status {status}: {body}")
+
+
+class BaseApi:
+    """
+    Base class of an Admin API entity endpoint, e.g. /{workspace}/services
+    """
+    _entity = None
+    # the max page size accepted by Kong Admin API
+    page_size = 1000
+
+    def __init__(self, session: Session, admin_url: str, workspace_name: str = "default", concurrency: int = 8):
+        self._session = session
+        self._admin_url = admin_url.rstrip("/")
+        self._workspace_name = workspace_name
+        # max number of requests in flight for bulk operations, bounded by the connection pool size
+        self.concurrency = concurrency
+
+    @property
+    def session(self):
+        return self._session
+
+    @property
+    def workspace_name(self):
+        return self._workspace_name
+
+    @property
+    def endpoint(self):
+        return f"{self._admin_url}/{self._workspace_name}/{self._entity}"
+
+    def request(self, method, url, **kwargs):
+        response = self._session.request(method, url, **kwargs)
+        logger.debug(f"{method} {url} => {response.status_code}")
+        if response.status_code >= 400:
+            raise AdminApiError(method, url, response.status_code, response.text)
+        if response.status_code == 204 or not response.content:
+            return None
+        return response.json()
+
+    def list(self, size=None, offset=None):
+        """
+        :return: one page of entities and the offset of the next page, the offset is None on the last page
+        """
+        params = {"size": size or self.page_size}
+        if offset:
+            params["offset"] = offset
+        body = self.request("GET", self.endpoint, params=params)
+        return body["data"], body.get("offset")
+
+    def iter_all(self, size=None):
+        offset = None
+        while True:
+            data, offset = self.list(size=size, offset=offset)
+            yield from data
+            if not offset:
+                return
+
+    def ids(self):
+        return [entity["id"] for entity in self.iter_all()]
+
+    def count(self):
+        return sum(1 for _ in self.iter_all())
+
+    def is_empty(self):
+        """
+        Check the endpoint has no entity with a single request
+        """
+        data, _ = self.list(size=1)
+        return not data
+
+    def get(self, id_or_name):
+        return self.request("GET", f"{self.endpoint}/{id_or_name}")
+
+    def create(self, payload: dict):
+        return self.request("POST", self.endpoint, json=payload)
+
+    def update(self, id_or_name, payload: dict):
+        """
+        Update the given fields of an entity
+        """
+        return self.request("PATCH", f"{self.endpoint}/{id_or_name}", json=payload)
+
+    def upsert(self, id_or_name, payload: dict):
+        """
+        Replace the entity of id_or_name, or create it if it doesn't exist
+        """
+        return self.request("PUT", f"{self.endpoint}/{id_or_name}", json=payload)
+
+    def create_many(self, payloads):
+        """
+        Create entities concurrently
+        :return: the created entities, in the order of payloads
+        """
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            return list(executor.map(self.create, payloads))
+
+    def delete(self, id_or_name, missing_ok=False):
+        """
+        :param missing_ok: don't raise if the entity doesn't exist, e.g. it was already deleted by the test
+        """
+        try:
+            self.request("DELETE", f"{self.endpoint}/{id_or_name}")
+        except AdminApiError as e:
+            if not (missing_ok and e.status == 404):
+                raise
+
+    def delete_many(self, ids, missing_ok=False):
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            list(executor.map(lambda id_or_name: self.delete(id_or_name, missing_ok), ids))
+
+    def delete_all(self):
+        """
+        Collect all ids first, deleting while paging would shift the offsets, then delete them concurrently
+        :return: the number of deleted entities
+        """
+        ids = self.ids()
+        self.delete_many(ids)
+        logger.debug(f"deleted {len(ids)} {self._entity} in workspace {self._workspace_name}")
+        return len(ids)
@@ -0,0 +1,39 @@
+import os
+import random
+from utils.log_util import logger
+from utils.random_util import RandomUtil
+from utils.impact_selector import ImpactSelector
+from utils.duration_history import DurationHistory, DurationPlugin
+
+test_root = os.path.dirname(__file__)
+
+
+def pytest_configure(config):
+    # configure logging once per session, each pytest-xdist worker writes its own log file
+    logger.configure(worker=os.getenv("PYTEST_XDIST_WORKER"), json_format=os.getenv("LOG_FORMAT") == "json")
+    # the seed of the random test data is chosen by the controller, pytest-xdist workers inherit it from the env
+    if not os.getenv("TEST_SEED"):
+        os.environ["TEST_SEED"] = str(random.SystemRandom().getrandbits(32))
+    RandomUtil.seed(int(os.environ["TEST_SEED"]))
+    # run only the tests impacted by the changes since a recorded baseline, see ImpactSelector
+    mode = os.getenv("TEST_IMPACT")
+    if mode:
+        index_path = os.getenv("TEST_IMPACT_INDEX", os.path.join(os.path.dirname(test_root), ".test_impact", "index.json"))
+        config.pluginmanager.register(ImpactSelector(mode, index_path, test_root), "impact_selector")
+    # durations of every run are kept to schedule "--dist loadscope" runs longest first
+    history_path = os.getenv("DURATION_HISTORY", os.path.join(os.path.dirname(test_root), ".test_durations.json"))
+    config.pluginmanager.register(DurationPlugin(DurationHistory(history_path)), "duration_history")
+
+
+def pytest_report_header(config):
+    seed = os.environ["TEST_SEED"]
+    return f"random test data seed: {seed}, TEST_SEED={seed} reproduces it"
+
+
+def pytest_runtest_setup(item):
+    # each test draws its own sequence from the seed, so that it gets the same data whatever runs before it
+    RandomUtil.seed(int(os.environ["TEST_SEED"]), item.nodeid)
+
+
+def pytest_unconfigure(config):
+    logger.shutdown()
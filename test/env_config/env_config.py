@@ -29,6 +29,109 @@ class EnvConfig:
     def mode(self):
         return self._conf.get(self.env_name, "mode")
 
+    @property
+    def headless(self):
+        return self.mode == "headless" or bool(os.getenv("GITHUB_RUN"))
+
+    @property
+    def username(self):
+        """
+        :return: Kong Manager user, None if the env doesn't need a login
+        """
+        return self._conf.get(self.env_name, "username", fallback=None)
+
+    @property
+    def password(self):
+        """
+        :return: Kong Manager password, read from the environment variable KONG_MANAGER_PASSWORD if it is set
+        """
+        return os.getenv("KONG_MANAGER_PASSWORD") or self._conf.get(self.env_name, "password", fallback=None)
+
+    @property
+    def admin_url(self):
+        """
+        :return: url of Kong Admin API, None if the env does not expose it
+        """
+        return self._conf.get(self.env_name, "admin_url", fallback=None)
+
+    @property
+    def proxy_url(self):
+        """
+        :return: url of the Kong proxy, None if the env does not expose it
+        """
+        return self._conf.get(self.env_name, "proxy_url", fallback=None)
+
+    @property
+    def upstream_host(self):
+        """
+        :return: host name of this machine as seen from Kong, services of proxy tests point at upstreams served here
+        """
+        return self._conf.get(self.env_name, "upstream_host", fallback="127.0.0.1")
+
+    @property
+    def postgres(self):
+        """
+        :return: host:port of the Kong database, None if the env does not expose it
+        """
+        return self._conf.get(self.env_name, "postgres", fallback=None)
+
+    @property
+    def db_container(self):
+        """
+        :return: docker container of the Kong database, kong_state snapshots are taken in it, None if not available
+        """
+        return self._conf.get(self.env_name, "db_container", fallback=None)
+
+    @property
+    def health_gate(self):
+        """
+        :return: whether the session waits for Kong to be healthy before the first test, overridden by env HEALTH_GATE
+        """
+        return self._get_flag("health_gate", fallback=True)
+
+    @property
+    def health_gate_timeout(self):
+        """
+        :return: seconds to wait for Kong to be healthy, overridden by env HEALTH_GATE_TIMEOUT
+        """
+        return float(os.getenv("HEALTH_GATE_TIMEOUT") or self._conf.get(self.env_name, "health_gate_timeout",
+                                                                          fallback="120"))
+
+    @property
+    def trace_retention(self):
+        """
+        :return: failed|all|off, can be overridden by the environment variable TRACE_RETENTION
+        """
+        return os.getenv("TRACE_RETENTION") or self._conf.get(self.env_name, "trace_retention", fallback="failed")
+
+    @property
+    def asset_cache(self):
+        """
+        :return: whether Kong Manager static assets are cached across contexts, overridden by env ASSET_CACHE
+        """
+        return self._get_flag("asset_cache")
+
+    @property
+    def block_telemetry(self):
+        """
+        :return: whether analytics/telemetry requests are aborted, overridden by env BLOCK_TELEMETRY
+        """
+        return self._get_flag("block_telemetry")
+
+    @property
+    def hermetic(self):
+        """
+        :return: whether the Admin API is served by the in-process stand-in instead of a Kong container,
+            overridden by env HERMETIC, tests that need Kong Manager are skipped
+        """
+        return self._get_flag("hermetic")
+
+    def _get_flag(self, option, fallback=False):
+        value = os.getenv(option.upper())
+        if value is not None:
+            return value.lower() in ("1", "yes", "true", "on")
+        return self._conf.getboolean(self.env_name, option, fallback=fallback)
+
 
     @property
     def env(self):
@@ -0,0 +1,472 @@
+import copy
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+class AdminError(Exception):
+    """
+    An error answered by KongAdminMockServer, status and body follow the Kong Admin API
+    """
+
+    def __init__(self, status, body):
+        self.status = status
+        self.body = body
+        super().__init__(body["message"])
+
+
+class UniqueViolation(AdminError):
+    def __init__(self, field, value):
+        super().__init__(409, {
+            "code": 5,
+            "name": "unique constraint violation",
+            "message": f"UNIQUE violation detected on '{{{field}=\"{value}\"}}'",
+            "fields": {field: value}
+        })
+
+
+class ForeignKeyViolation(AdminError):
+    def __init__(self, message):
+        super().__init__(400, {"code": 4, "name": "foreign key violation", "message": message})
+
+
+class NotFound(AdminError):
+    def __init__(self):
+        super().__init__(404, {"message": "Not found"})
+
+
+class BadRequest(AdminError):
+    def __init__(self, message):
+        super().__init__(400, {"message": message})
+
+
+def _now():
+    return int(time.time())
+
+
+def _service_fields(payload):
+    """
+    Kong stores the url of a service as protocol, host, port and path
+    """
+    row = dict(payload)
+    url = row.pop("url", None)
+    if url:
+        parsed = urlparse(url)
+        row.update(protocol=parsed.scheme, host=parsed.hostname, path=parsed.path or None,
+                   port=parsed.port or (443 if parsed.scheme in ("https", "grpcs", "wss", "tls") else 80))
+    return row
+
+
+class KongAdminStore:
+    """
+    In-memory store of the entities served by KongAdminMockServer, entities are kept per workspace
+    in insertion order, which is also the paging order
+    """
+    entities = ("services", "routes")
+    workspaces = "workspaces"
+    # max page size of Kong Admin API
+    max_page_size = 1000
+    defaults = {
+        "services": {
+            "protocol": "http", "host": None, "port": 80, "path": None, "retries": 5, "connect_timeout": 60000,
+            "write_timeout": 60000, "read_timeout": 60000, "tags": None, "enabled": True,
+            "client_certificate": None, "ca_certificates": None, "tls_verify": None, "tls_verify_depth": None
+        },
+        "routes": {
+            "protocols": ["http", "https"], "methods": None, "hosts": None, "paths": None, "headers": None,
+            "strip_path": True, "preserve_host": False, "https_redirect_status_code": 426, "regex_priority": 0,
+            "path_handling": "v0", "request_buffering": True, "response_buffering": True, "tags": None
+        },
+        "workspaces": {"comment": None, "config": {}, "meta": {}}
+    }
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._data = {}
+        self._workspaces = {}
+        self.create_workspace({"name": "default"})
+
+    def _table(self, workspace, entity):
+        if workspace not in self._data:
+            raise NotFound()
+        return self._data[workspace].setdefault(entity, {})
+
+    @staticmethod
+    def _find(table, id_or_name):
+        if id_or_name in table:
+            return table[id_or_name]
+        for entity in table.values():
+            if entity.get("name") == id_or_name:
+                return entity
+        return None
+
+    @staticmethod
+    def _check_unique(table, row):
+        name = row.get("name")
+        if name is None:
+            return
+        for other in table.values():
+            if other.get("name") == name and other["id"] != row["id"]:
+                raise UniqueViolation("name", name)
+
+    def _new_row(self, entity, payload):
+        now = _now()
+        row = dict(self.defaults[entity])
+        row.update(_service_fields(payload) if entity == "services" else payload)
+        row.setdefault("id", str(uuid.uuid4()))
+        row.setdefault("name", None)
+        row.update(created_at=now, updated_at=now)
+        return row
+
+    def snapshot(self):
+        """
+        :return: a copy of all workspaces and their entities, see restore
+        """
+        with self._lock:
+            return copy.deepcopy((self._data, self._workspaces))
+
+    def restore(self, snapshot):
+        data, workspaces = copy.deepcopy(snapshot)
+        with self._lock:
+            self._data, self._workspaces = data, workspaces
+
+    # workspaces
+
+    def list_workspaces(self, size, offset):
+        with self._lock:
+            rows = list(self._workspaces.values())
+        return _paginate(rows, size, offset)
+
+    def get_workspace(self, id_or_name):
+        with self._lock:
+            row = self._find(self._workspaces, id_or_name)
+        if row is None:
+            raise NotFound()
+        return row
+
+    def create_workspace(self, payload):
+        row = self._new_row(self.workspaces, payload)
+        with self._lock:
+            self._check_unique(self._workspaces, row)
+            self._workspaces[row["id"]] = row
+            self._data[row["name"]] = {}
+        return row
+
+    def update_workspace(self, id_or_name, payload):
+        with self._lock:
+            row = self.get_workspace(id_or_name)
+            if payload.get("name", row["name"]) != row["name"]:
+                raise BadRequest("a workspace can't be renamed")
+            row.update(payload, id=row["id"], created_at=row["created_at"], updated_at=_now())
+        return row
+
+    def upsert_workspace(self, id_or_name, payload):
+        """
+        PUT: replace the workspace of id_or_name, or create it
+        """
+        with self._lock:
+            existing = self._find(self._workspaces, id_or_name)
+            if existing is None:
+                key = "id" if _looks_like_id(id_or_name) else "name"
+                return self.create_workspace({**payload, key: id_or_name})
+            if payload.get("name", existing["name"]) != existing["name"]:
+                raise BadRequest("a workspace can't be renamed")
+            row = self._new_row(self.workspaces, {**payload, "id": existing["id"], "name": existing["name"]})
+            row["created_at"] = existing["created_at"]
+            self._workspaces[row["id"]] = row
+        return row
+
+    def delete_workspace(self, id_or_name):
+        with self._lock:
+            row = self._find(self._workspaces, id_or_name)
+            if row is None:
+                return
+            if row["name"] == "default":
+                raise BadRequest("the default workspace can't be deleted")
+            if any(self._data.get(row["name"], {}).values()):
+                raise BadRequest(f"workspace {row['name']} is not empty")
+            del self._workspaces[row["id"]]
+            self._data.pop(row["name"], None)
+
+    # services and routes
+
+    def list(self, workspace, entity, size, offset, service=None):
+        with self._lock:
+            rows = list(self._table(workspace, entity).values())
+            if service is not None:
+                service_id = self.get(workspace, "services", service)["id"]
+                rows = [row for row in rows if row["service"]["id"] == service_id]
+        return _paginate(rows, size, offset)
+
+    def get(self, workspace, entity, id_or_name):
+        with self._lock:
+            row = self._find(self._table(workspace, entity), id_or_name)
+        if row is None:
+            raise NotFound()
+        return row
+
+    def _resolve_service(self, workspace, row):
+        reference = _ref(row.get("service"))
+        service = self._find(self._table(workspace, "services"), reference) if reference else None
+        if service is None:
+            raise ForeignKeyViolation(f"the foreign key '{{id=\"{reference}\"}}' does not reference an existing "
+                                      f"'services' entity.")
+        row["service"] = {"id": service["id"]}
+
+    def create(self, workspace, entity, payload):
+        row = self._new_row(entity, payload)
+        with self._lock:
+            table = self._table(workspace, entity)
+            if entity == "routes":
+                self._resolve_service(workspace, row)
+            if row["id"] in table:
+                raise UniqueViolation("id", row["id"])
+            self._check_unique(table, row)
+            table[row["id"]] = row
+        return row
+
+    def update(self, workspace, entity, id_or_name, payload):
+        with self._lock:
+            existing = self.get(workspace, entity, id_or_name)
+            row = dict(existing)
+            row.update(_service_fields(payload) if entity == "services" else payload)
+            row.update(id=existing["id"], created_at=existing["created_at"], updated_at=_now())
+            table = self._table(workspace, entity)
+            if entity == "routes":
+                self._resolve_service(workspace, row)
+            self._check_unique(table, row)
+            table[row["id"]] = row
+        return row
+
+    def upsert(self, workspace, entity, id_or_name, payload):
+        """
+        PUT: replace the entity of id_or_name, or create it
+        """
+        with self._lock:
+            existing = self._find(self._table(workspace, entity), id_or_name)
+            if existing is None:
+                key = "id" if _looks_like_id(id_or_name) else "name"
+                return self.create(workspace, entity, {**payload, key: id_or_name})
+            row = self._new_row(entity, {**payload, "id": existing["id"]})
+            row.setdefault("name", existing["name"])
+            row["created_at"] = existing["created_at"]
+            table = self._table(workspace, entity)
+            if entity == "routes":
+                self._resolve_service(workspace, row)
+            self._check_unique(table, row)
+            table[row["id"]] = row
+        return row
+
+    def delete(self, workspace, entity, id_or_name):
+        with self._lock:
+            table = self._table(workspace, entity)
+            row = self._find(table, id_or_name)
+            if row is None:
+                return
+            if entity == "services" and any(route["service"]["id"] == row["id"]
+                                             for route in self._table(workspace, "routes").values()):
+                raise ForeignKeyViolation("an existing 'routes' entity references this 'services' entity")
+            del table[row["id"]]
+
+
+def _paginate(rows, size, offset):
+    """
+    :return: one page of rows and the offset of the next page, None on the last page
+    """
+    try:
+        start = int(offset) if offset else 0
+    except ValueError:
+        raise BadRequest("invalid offset")
+    if start < 0:
+        raise BadRequest("invalid offset")
+    next_offset = str(start + size) if start + size < len(rows) else None
+    return rows[start:start + size], next_offset
+
+
+def _ref(reference):
+    if not reference:
+        return None
+    if isinstance(reference, str):
+        return reference
+    return reference.get("id") or reference.get("name")
+
+
+def _looks_like_id(value):
+    return len(value) == 36 and value.count("-") == 4
+
+
+class KongAdminHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, without TCP_NODELAY every response waits for a delayed ack
+    disable_nagle_algorithm = True
+    store: KongAdminStore
+
+    def log_message(self, format, *args):
+        pass
+
+    def _route(self):
+        """
+        :return: workspace, path segments after the workspace and query of the request path
+        """
+        parsed = urlparse(self.path)
+        segments = [s for s in parsed.path.split("/") if s]
+        workspace = "default"
+        if segments and segments[0] not in KongAdminStore.entities + (KongAdminStore.workspaces,):
+            workspace = segments.pop(0)
+        return workspace, segments, parse_qs(parsed.query)
+
+    def _send(self, status, body=None):
+        payload = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_json(self):
+        try:
+            return json.loads(self._body or b"{}")
+        except ValueError:
+            raise BadRequest("Cannot parse JSON body")
+
+    @staticmethod
+    def _page_size(query):
+        try:
+            size = int(query.get("size", ["100"])[0])
+        except ValueError:
+            size = 0
+        if not 1 <= size <= KongAdminStore.max_page_size:
+            raise BadRequest(f"size must be an integer between 1 and {KongAdminStore.max_page_size}")
+        return size
+
+    def _send_page(self, path, query, list_rows):
+        size = self._page_size(query)
+        data, next_offset = list_rows(size, query.get("offset", [None])[0])
+        body = {"data": data, "next": None}
+        if next_offset:
+            body["offset"] = next_offset
+            body["next"] = f"{path}?offset={next_offset}&size={size}"
+        self._send(200, body)
+
+    def _dispatch(self):
+        bare_path = urlparse(self.path).path.rstrip("/")
+        if self.command == "GET" and bare_path == "/status":
+            return self._send(200, {"database": {"reachable": True}, "server": {"connections_active": 1}})
+        if self.command == "DELETE" and bare_path == "/cache":
+            # nothing is cached by the stand-in
+            return self._send(204)
+        workspace, segments, query = self._route()
+        if not segments:
+            raise NotFound()
+        entity, rest = segments[0], segments[1:]
+        path = urlparse(self.path).path
+        if entity == KongAdminStore.workspaces:
+            return self._do_workspaces(rest, path, query)
+        if entity not in KongAdminStore.entities or len(rest) > 2:
+            raise NotFound()
+        if len(rest) == 2:
+            # routes of a service: /services/{id_or_name}/routes
+            if entity != "services" or rest[1] != "routes":
+                raise NotFound()
+            return self._do_service_routes(workspace, rest[0], path, query)
+        id_or_name = rest[0] if rest else None
+        store = self.store
+        if self.command == "GET" and id_or_name:
+            return self._send(200, store.get(workspace, entity, id_or_name))
+        if self.command == "GET":
+            return self._send_page(path, query, lambda size, offset: store.list(workspace, entity, size, offset))
+        if self.command == "POST" and not id_or_name:
+            return self._send(201, store.create(workspace, entity, self._read_json()))
+        if self.command == "PATCH" and id_or_name:
+            return self._send(200, store.update(workspace, entity, id_or_name, self._read_json()))
+        if self.command == "PUT" and id_or_name:
+            return self._send(200, store.upsert(workspace, entity, id_or_name, self._read_json()))
+        if self.command == "DELETE" and id_or_name:
+            store.delete(workspace, entity, id_or_name)
+            return self._send(204)
+        raise NotFound()
+
+    def _do_service_routes(self, workspace, service, path, query):
+        store = self.store
+        if self.command == "GET":
+            return self._send_page(
+                path, query, lambda size, offset: store.list(workspace, "routes", size, offset, service=service))
+        if self.command == "POST":
+            payload = self._read_json()
+            payload["service"] = {"id": store.get(workspace, "services", service)["id"]}
+            return self._send(201, store.create(workspace, "routes", payload))
+        raise NotFound()
+
+    def _do_workspaces(self, rest, path, query):
+        id_or_name = rest[0] if rest else None
+        if len(rest) > 1:
+            raise NotFound()
+        store = self.store
+        if self.command == "GET" and id_or_name:
+            return self._send(200, store.get_workspace(id_or_name))
+        if self.command == "GET":
+            return self._send_page(path, query, store.list_workspaces)
+        if self.command == "POST" and not id_or_name:
+            return self._send(201, store.create_workspace(self._read_json()))
+        if self.command == "PATCH" and id_or_name:
+            return self._send(200, store.update_workspace(id_or_name, self._read_json()))
+        if self.command == "PUT" and id_or_name:
+            return self._send(200, store.upsert_workspace(id_or_name, self._read_json()))
+        if self.command == "DELETE" and id_or_name:
+            store.delete_workspace(id_or_name)
+            return self._send(204)
+        raise NotFound()
+
+    def _handle(self):
+        # the body is read before dispatching, a body left unread by an error would be parsed as the next request of
+        # the keep-alive connection
+        self._body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        try:
+            self._dispatch()
+        except AdminError as e:
+            self._send(e.status, e.body)
+        except Exception as e:
+            self._send(500, {"message": f"An unexpected error occurred: {type(e).__name__}: {e}"})
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _handle
+
+
+class KongAdminMockServer:
+    """
+    A stand-in of the Kong Admin API (the :8001 listener) with services, routes and workspaces kept in memory,
+    so that the Admin API client and the fixtures can run without any Kong container, it starts in milliseconds
+
+    >>> with KongAdminMockServer() as server:
+    ...     AdminApi(server.url).gateway_services.count()
+    0
+    """
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self.store = KongAdminStore()
+        handler = type("Handler", (KongAdminHandler,), {"store": self.store})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,74 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class UpstreamHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    delay = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        if self.delay:
+            time.sleep(self.delay)
+        payload = json.dumps({"method": self.command, "path": self.path}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _handle
+
+
+class UpstreamMockServer:
+    """
+    A stand-in upstream of the gateway services under test, it answers every request with 200 and the method and path
+    it received, so that proxy tests measure Kong rather than a remote site. Kong reaches it at
+    EnvConfig.upstream_host, bind it to 0.0.0.0 when Kong runs in a container
+
+    >>> with UpstreamMockServer("0.0.0.0") as upstream:
+    ...     admin_api.gateway_services.new_gateway_service("kim", url=upstream.url_for("host.docker.internal"))
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, delay_ms=0):
+        handler = type("Handler", (UpstreamHandler,), {"delay": delay_ms / 1000})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    @property
+    def url(self):
+        return self.url_for(self._server.server_address[0])
+
+    def url_for(self, host):
+        """
+        :return: url of the upstream as seen from host, e.g. the docker host seen from the Kong container
+        """
+        return f"http://{host}:{self.port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,220 @@
+import asyncio
+import re
+from fnmatch import fnmatch
+from urllib.parse import urlparse
+from playwright.async_api import Page, Dialog, Locator, Error, expect
+from utils.log_util import logger
+from utils.action_timer import action_timer
+from ..locators import BasePageLocators, selectors
+
+
+class BasePage(BasePageLocators):
+    """
+    Async mirror of pages.base_page.BasePage built on playwright.async_api, the locators are shared with the sync
+    page objects, so that many pages can be driven concurrently by one event loop
+    """
+    _uri = None
+    # actions of page objects timed by action_timer, as patterns of method names
+    timed_actions = ("goto_*", "go_to_*", "new_*", "delete_all_*", "count_*", "exists")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, attr in list(vars(cls).items()):
+            if callable(attr) and any(fnmatch(name, pattern) for pattern in cls.timed_actions):
+                setattr(cls, name, action_timer.timed(f"{cls.__name__}.{name}")(attr))
+
+    def __init__(self, page: Page, uri: str = '', admin_api=None, ledger=None):
+        self._uri = uri
+        self._page = page
+        self._admin_api = admin_api
+        self._ledger = ledger
+        # time.perf_counter() of the last form submit, config propagation is measured from it
+        self.submitted_at = None
+
+    @property
+    def base_url(self):
+        return self._page.context._impl_obj._options.get("baseURL")
+
+    @property
+    def page(self):
+        return self._page
+
+    @property
+    def admin_api(self):
+        """
+        Kong Admin API client used for bulk operations, None if the page object works through the UI only,
+        the client is blocking, so it is called in a thread to keep the event loop free
+        """
+        return self._admin_api
+
+    @property
+    def ledger(self):
+        """
+        EntityLedger recording the entities created through the page object, None if they are not recorded
+        """
+        return self._ledger
+
+    async def call_admin_api(self, func, *args):
+        return await asyncio.to_thread(func, *args)
+
+    @classmethod
+    def locator_registry(cls):
+        """
+        :return: the selectors of the page object by attribute name, each is built into a Locator once per page object
+        """
+        return selectors(cls)
+
+    async def validate_locators(self):
+        """
+        Build every selector of the page object and evaluate it once
+        :raise ValueError: listing the malformed selectors
+        """
+        errors = {}
+        for name, selector in self.locator_registry().items():
+            try:
+                await getattr(self, name).count()
+            except Error as e:
+                errors[name] = f"{selector.strategy} {selector!r}: {e.message}"
+        if errors:
+            raise ValueError(f"malformed selectors of {type(self).__name__}: {errors}")
+
+    async def open(self, **kwargs):
+        await self.page.goto(self._uri)
+
+    async def reload(self, **kwargs):
+        await self.page.reload(**kwargs)
+
+    async def go_back(self, **kwargs):
+        await self.page.go_back(**kwargs)
+
+    async def go_forward(self, **kwargs):
+        await self.page.go_forward(**kwargs)
+
+    async def close(self):
+        await self.page.close()
+
+    async def handle_dialog(self, dialog: Dialog, dismiss=None):
+        logger.debug(f"dialog with message {dialog.message}")
+        if dismiss:
+            await dialog.dismiss()
+        else:
+            await dialog.accept()
+
+    async def handle_popup(self, popup):
+        await popup.wait_for_load_state()
+        logger.debug(await popup.title())
+
+    @action_timer.timed("BasePage.exists")
+    async def exists(self, locator, state="visible", timeout=None):
+        """
+        Wait for the locator to reach the state, it returns as soon as the DOM matches,
+        timeout defaults to the default timeout of the context
+        """
+        logger.debug(f"wait for locator to be {state} in {timeout or 'default'} ms, locator={locator}")
+        await locator.wait_for(state=state, timeout=timeout)
+
+    def wait_for_api(self, entity, method="GET"):
+        """
+        Wait for the response of the Kong Admin API request that Kong Manager makes for entity, e.g.
+
+            async with self.wait_for_api("services", "POST") as response_info:
+                await self.page.locator(save).click()
+            response = await response_info.value
+        """
+        path = re.compile(rf"/{entity}(/[^/]+)?/?$")
+
+        def is_api_response(response):
+            request = response.request
+            return request.resource_type in ("fetch", "xhr") and request.method == method \
+                and path.search(urlparse(response.url).path) is not None
+
+        return self.page.expect_response(is_api_response)
+
+    async def count_list_entities(self, response, entity):
+        """
+        Count the entities of a list, the rows only show the current page: the total of the list API response
+        is used when Kong returns one, otherwise the list is paged through and the entities of each page response
+        are added up
+        :param response: the Admin API response that rendered the first page, e.g. returned by goto_gateway_service
+        """
+        body = await response.json()
+        if body.get("total") is not None:
+            return body["total"]
+        count = len(body["data"])
+        while body.get("next"):
+            response = await self.next_page(entity)
+            body = await response.json()
+            count += len(body["data"])
+        return count
+
+    async def next_page(self, entity):
+        """
+        :return: the Admin API response of the next page of the list
+        """
+        async with self.wait_for_api(entity) as response_info:
+            await self.pagination_next.click()
+        response = await response_info.value
+        await self.exists(self.list_rows.first)
+        return response
+
+    async def previous_page(self, entity):
+        async with self.wait_for_api(entity) as response_info:
+            await self.pagination_previous.click()
+        response = await response_info.value
+        await self.exists(self.list_rows.first)
+        return response
+
+    async def set_page_size(self, entity, size):
+        """
+        :param size: one of page_sizes
+        :return: the Admin API response of the first page of the new size
+        """
+        if size not in self.page_sizes:
+            raise ValueError(f"page size {size} is not one of {self.page_sizes}")
+        await self.page_size_dropdown.click()
+        async with self.wait_for_api(entity) as response_info:
+            await self.page.get_by_text(f"{size} items per page", exact=True).click()
+        return await response_info.value
+
+    async def search(self, entity, text):
+        """
+        Filter the list, Kong Manager looks the entity up by its exact name or id
+        :return: the Admin API response of the search
+        """
+        async with self.wait_for_api(entity) as response_info:
+            await self.search_input.fill(text)
+        return await response_info.value
+
+    async def delete_row(self, row: Locator, entity):
+        """
+        Delete the entity of a list row through its overflow menu and the confirmation modal
+        """
+        name = await row.get_attribute("data-testid")
+        await row.locator(BasePage.overflow_actions_button).click()
+        await row.locator(BasePage.delete_action).click()
+        await self.confirmation_input.fill(name)
+        delete_button = self.modal_action_button
+        await expect(delete_button).to_be_enabled(timeout=1000)
+        async with self.wait_for_api(entity, "DELETE") as response_info:
+            await delete_button.click()
+        response = await response_info.value
+        if not response.ok:
+            raise AssertionError(f"failed to delete {entity} {name}: {response.status} {await response.text()}")
+        await self.exists(self.page.locator(f"{BasePage.list_rows}[data-testid='{name}']"), state="detached")
+
+    async def delete_all_rows(self, goto_list, entity):
+        """
+        Delete all rows of a list through the UI, the list is reloaded until it is empty
+        :param goto_list: coroutine function navigating to the list
+        :return: number of deleted rows
+        """
+        deleted = 0
+        rows = self.list_rows
+        while True:
+            await goto_list()
+            count = await rows.count()
+            if count == 0:
+                return deleted
+            for _ in range(count):
+                await self.delete_row(rows.first, entity)
+            deleted += count
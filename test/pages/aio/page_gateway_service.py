@@ -0,0 +1,105 @@
+import time
+from .base_page import BasePage
+from ..locators import GatewayServiceLocators
+from utils.action_timer import action_timer
+
+
+class GatewayService(BasePage, GatewayServiceLocators):
+
+    async def __wait_for_list_to_be_visible(self):
+        await self.exists(self.list_container)
+
+    async def __wait_for_list_to_be_rendered(self):
+        # either the rows or the empty state are rendered once the list data arrives
+        rows = self.list_rows.first
+        await self.exists(rows.or_(self.new_gateway_service_button))
+
+    async def goto_gateway_service(self, base_url, workspace_name="default"):
+        url = f"{base_url}/{workspace_name}/services/"
+        async with self.wait_for_api("services") as response_info:
+            await self.page.goto(url, wait_until="commit")
+        await self.__wait_for_list_to_be_visible()
+        await self.__wait_for_list_to_be_rendered()
+        return await response_info.value
+
+    async def __click_add_gateway_service(self):
+        await self.__wait_for_list_to_be_visible()
+        count = await self.new_gateway_service_button.count()
+        if count == 0:
+            await self.toolbar_add_button.click()
+        else:
+            await self.new_gateway_service_button.click()
+
+    async def delete_all_gateway_services(self, base_url, workspace_name="default"):
+        """
+        Delete all gateway services of the workspace, in bulk through the Admin API if the page object has a client,
+        otherwise row by row through the UI
+        :return: number of deleted gateway services
+        """
+        if not self.admin_api:
+            return await self.delete_all_rows(lambda: self.goto_gateway_service(base_url, workspace_name), "services")
+        gateway_services = self.admin_api.for_workspace(workspace_name).gateway_services
+        deleted = await self.call_admin_api(gateway_services.delete_all)
+        assert await self.call_admin_api(gateway_services.is_empty), \
+            f"gateway services are left in workspace {workspace_name}"
+        return deleted
+
+    async def count_gateway_services(self, base_url, workspace_name="default"):
+        return await self.count_list_entities(await self.goto_gateway_service(base_url, workspace_name), "services")
+
+    async def new_gateway_service(self, kwargs):
+        """
+        :return: the response of the Admin API request made by the form
+        """
+        await self.__click_add_gateway_service()
+        await self.__new_gateway_service_general_info(**kwargs)
+        await self.__new_gateway_service_endpoint(**kwargs)
+        await self.__new_gateway_service_advanced_fields(**kwargs)
+        with action_timer.measure("GatewayService.submit_gateway_service"):
+            async with self.wait_for_api("services", "POST") as response_info:
+                self.submitted_at = time.perf_counter()
+                await self.save.click()
+        response = await response_info.value
+        if response.ok and self.ledger is not None:
+            self.ledger.record("services", await response.json())
+        return response
+
+    async def __new_gateway_service_general_info(self, **kwargs):
+        name = kwargs.get("name", None)
+        if name:
+            await self.name.fill(name)
+        tags = kwargs.get("tags", None)
+        if tags:
+            await self.tags.fill(tags)
+
+    async def __new_gateway_service_endpoint(self, **kwargs):
+        url = kwargs.get("url", None)
+        if url:
+            await self.url.fill(url)
+        else:
+            # choose to use separate elements
+            await self.separate_elements.check()
+            protocol = kwargs.get("protocol")
+            path = kwargs.get("path", None)
+            await self.protocol_select.click()
+            item = self.page.get_by_test_id(GatewayService.protocol_item(protocol))
+            await item.get_by_role("button", name=protocol).click()
+            if protocol.startswith(GatewayService.path_protocols):
+                path_input = self.path
+                assert await path_input.count() != 0
+                await path_input.fill(path)
+            host = kwargs.get("host", None)
+            port = kwargs.get("port", None)
+            await self.host.fill(host)
+            await self.port.fill(port)
+
+    async def __new_gateway_service_advanced_fields(self, **kwargs):
+        if kwargs:
+            await self.view_advanced_fields.click()
+        for key, test_id in GatewayService.advanced_fields.items():
+            value = kwargs.get(key, None)
+            if value:
+                await self.page.get_by_test_id(test_id).fill(value)
+        tls_verify = kwargs.get("tls_verify")
+        if tls_verify:
+            await self.tls_verify.check()
@@ -0,0 +1,68 @@
+import time
+from .base_page import BasePage
+from ..locators import RouteLocators
+from utils.random_util import RandomUtil
+from utils.action_timer import action_timer
+
+
+class Route(BasePage, RouteLocators):
+
+    async def goto_routes(self, base_url, workspace_name="default"):
+        url = f"{base_url}/{workspace_name}/routes/"
+        async with self.wait_for_api("routes") as response_info:
+            await self.page.goto(url, wait_until="commit")
+        await self.__wait_for_list_to_be_visible()
+        await self.__wait_for_list_to_be_rendered()
+        return await response_info.value
+
+    async def __wait_for_list_to_be_visible(self):
+        await self.exists(self.list_container)
+
+    async def __wait_for_list_to_be_rendered(self):
+        # either the rows or the empty state are rendered once the list data arrives
+        rows = self.list_rows.first
+        await self.exists(rows.or_(self.new_route_button))
+
+    async def __click_new_route(self):
+        await self.__wait_for_list_to_be_visible()
+        buttons = self.new_route_button
+        if await buttons.count() == 0:
+            await self.toolbar_add_button.click()
+        else:
+            await buttons.click()
+
+    async def new_route(self, service_name, path="/", **kwargs):
+        """
+        :return: the response of the Admin API request made by the form
+        """
+        await self.__click_new_route()
+        await self.name.fill(RandomUtil.unique_name("route"))
+        await self.service.click()
+        await self.page.get_by_text(service_name).click()
+        await self.path.fill(path)
+        with action_timer.measure("Route.submit_route"):
+            async with self.wait_for_api("routes", "POST") as response_info:
+                self.submitted_at = time.perf_counter()
+                await self.submit.click()
+            await self.exists(self.footer_message)
+        response = await response_info.value
+        if response.ok and self.ledger is not None:
+            self.ledger.record("routes", await response.json())
+        return response
+
+    async def delete_all_routes(self, base_url, workspace_name="default"):
+        """
+        Delete all routes of the workspace, in bulk through the Admin API if the page object has a client,
+        otherwise row by row through the UI
+        :return: number of deleted routes
+        """
+        if not self.admin_api:
+            self.page.on("dialog", self.handle_dialog)
+            return await self.delete_all_rows(lambda: self.goto_routes(base_url, workspace_name), "routes")
+        routes = self.admin_api.for_workspace(workspace_name).routes
+        deleted = await self.call_admin_api(routes.delete_all)
+        assert await self.call_admin_api(routes.is_empty), f"routes are left in workspace {workspace_name}"
+        return deleted
+
+    async def count_route(self, base_url, workspace_name="default"):
+        return await self.count_list_entities(await self.goto_routes(base_url, workspace_name), "routes")
@@ -0,0 +1,12 @@
+from .base_page import BasePage
+from ..locators import WorkspaceLocators
+
+
+class Workspace(BasePage, WorkspaceLocators):
+
+    async def goto_workspace(self, base_url, workspace_name):
+        url = f"{base_url}/{workspace_name}/overview/"
+        await self.page.goto(url)
+
+    async def click_gateway_services(self):
+        await self.page.get_by_role("link", name=Workspace.gateway_services_link).click()
@@ -0,0 +1,9 @@
+from .base_page import BasePage
+from ..locators import WorkspacesLocators
+
+
+class Workspaces(BasePage, WorkspacesLocators):
+
+    async def go_to_workspace(self, base_url, workpace_name):
+        await self.page.goto(base_url)
+        await self.page.locator(Workspaces.workspace(workpace_name)).click()
@@ -1,13 +1,30 @@
-from playwright.sync_api import Page, Dialog
+import re
+from fnmatch import fnmatch
+from urllib.parse import urlparse
+from playwright.sync_api import Page, Dialog, Locator, Error, expect
 from utils.log_util import logger
+from utils.action_timer import action_timer
+from .locators import BasePageLocators, selectors
 
 
-class BasePage:
+class BasePage(BasePageLocators):
     _uri = None
+    # actions of page objects timed by action_timer, as patterns of method names
+    timed_actions = ("goto_*", "go_to_*", "new_*", "delete_all_*", "count_*", "exists")
 
-    def __init__(self, page: Page, uri: str = ''):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, attr in list(vars(cls).items()):
+            if callable(attr) and any(fnmatch(name, pattern) for pattern in cls.timed_actions):
+                setattr(cls, name, action_timer.timed(f"{cls.__name__}.{name}")(attr))
+
+    def __init__(self, page: Page, uri: str = '', admin_api=None, ledger=None):
         self._uri = uri
         self._page = page
+        self._admin_api = admin_api
+        self._ledger = ledger
+        # time.perf_counter() of the last form submit, config propagation is measured from it
+        self.submitted_at = None
 
     @property
     def base_url(self):
@@ -17,6 +34,42 @@ class BasePage:
     def page(self):
         return self._page
 
+    @property
+    def admin_api(self):
+        """
+        Kong Admin API client used for bulk operations, None if the page object works through the UI only
+        """
+        return self._admin_api
+
+    @property
+    def ledger(self):
+        """
+        EntityLedger recording the entities created through the page object, None if they are not recorded
+        """
+        return self._ledger
+
+    @classmethod
+    def locator_registry(cls):
+        """
+        :return: the selectors of the page object by attribute name, each is built into a Locator once per page object
+        """
+        return selectors(cls)
+
+    def validate_locators(self):
+        """
+        Build every selector of the page object and evaluate it once, Playwright only rejects a malformed selector
+        when it is evaluated, so that it fails at start-up instead of timing out in the middle of a test
+        :raise ValueError: listing the malformed selectors
+        """
+        errors = {}
+        for name, selector in self.locator_registry().items():
+            try:
+                getattr(self, name).count()
+            except Error as e:
+                errors[name] = f"{selector.strategy} {selector!r}: {e.message}"
+        if errors:
+            raise ValueError(f"malformed selectors of {type(self).__name__}: {errors}")
+
     def open(self, **kwargs):
         # if not self._uri:
         #     todo needs UI exception
@@ -46,6 +99,122 @@ class BasePage:
         popup.wait_for_load_state()
         logger.debug(popup.title())
 
-    def exists(self, locator, state="visible", timeout=5 * 1000):
-        logger.debug(f"wait for locator to be {state} in {timeout} ms, locator={locator}")
+    @action_timer.timed("BasePage.exists")
+    def exists(self, locator, state="visible", timeout=None):
+        """
+        Wait for the locator to reach the state, it returns as soon as the DOM matches,
+        timeout defaults to the default timeout of the context
+        """
+        logger.debug(f"wait for locator to be {state} in {timeout or 'default'} ms, locator={locator}")
         locator.wait_for(state=state, timeout=timeout)
+
+    def wait_for_api(self, entity, method="GET"):
+        """
+        Wait for the response of the Kong Admin API request that Kong Manager makes for entity, it replaces
+        generic load states which are meaningless in an SPA, e.g.
+
+            with self.wait_for_api("services", "POST") as response_info:
+                self.page.locator(save).click()
+            response = response_info.value
+        """
+        path = re.compile(rf"/{entity}(/[^/]+)?/?$")
+
+        def is_api_response(response):
+            request = response.request
+            return request.resource_type in ("fetch", "xhr") and request.method == method \
+                and path.search(urlparse(response.url).path) is not None
+
+        return self.page.expect_response(is_api_response)
+
+    def count_list_entities(self, response, entity):
+        """
+        Count the entities of a list, the rows only show the current page: the total of the list API response
+        is used when Kong returns one, otherwise the list is paged through and the entities of each page response
+        are added up
+        :param response: the Admin API response that rendered the first page, e.g. returned by goto_gateway_service
+        """
+        body = response.json()
+        if body.get("total") is not None:
+            return body["total"]
+        count = len(body["data"])
+        while body.get("next"):
+            body = self.next_page(entity).json()
+            count += len(body["data"])
+        return count
+
+    def next_page(self, entity):
+        """
+        :return: the Admin API response of the next page of the list
+        """
+        with self.wait_for_api(entity) as response_info:
+            self.pagination_next.click()
+        response = response_info.value
+        self.exists(self.list_rows.first)
+        return response
+
+    def previous_page(self, entity):
+        with self.wait_for_api(entity) as response_info:
+            self.pagination_previous.click()
+        response = response_info.value
+        self.exists(self.list_rows.first)
+        return response
+
+    def set_page_size(self, entity, size):
+        """
+        :param size: one of page_sizes
+        :return: the Admin API response of the first page of the new size
+        """
+        if size not in self.page_sizes:
+            raise ValueError(f"page size {size} is not one of {self.page_sizes}")
+        self.page_size_dropdown.click()
+        with self.wait_for_api(entity) as response_info:
+            self.page.get_by_text(f"{size} items per page", exact=True).click()
+        return response_info.value
+
+    def search(self, entity, text):
+        """
+        Filter the list, Kong Manager looks the entity up by its exact name or id
+        :return: the Admin API response of the search
+        """
+        with self.wait_for_api(entity) as response_info:
+            self.search_input.fill(text)
+        return response_info.value
+
+    def delete_row(self, row: Locator, entity):
+        """
+        Delete the entity of a list row through its overflow menu and the confirmation modal
+        """
+        name = row.get_attribute("data-testid")
+        # click ...
+        row.locator(BasePage.overflow_actions_button).click()
+        # click Delete
+        row.locator(BasePage.delete_action).click()
+        # fill in name to confirm delete
+        self.confirmation_input.fill(name)
+        # click "Yes, delete"
+        delete_button = self.modal_action_button
+        expect(delete_button).to_be_enabled(timeout=1000)
+        with self.wait_for_api(entity, "DELETE") as response_info:
+            delete_button.click()
+        response = response_info.value
+        if not response.ok:
+            raise AssertionError(f"failed to delete {entity} {name}: {response.status} {response.text()}")
+        self.exists(self.page.locator(f"{BasePage.list_rows}[data-testid='{name}']"), state="detached")
+
+    def delete_all_rows(self, goto_list, entity):
+        """
+        Delete all rows of a list through the UI, the list re-renders and paginates while rows are deleted,
+        so it is reloaded until it is empty
+        :param goto_list: function navigating to the list
+        :return: number of deleted rows
+        """
+        deleted = 0
+        rows = self.list_rows
+        while True:
+            goto_list()
+            count = rows.count()
+            if count == 0:
+                return deleted
+            for _ in range(count):
+                self.delete_row(rows.first, entity)
+            deleted += count
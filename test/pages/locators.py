@@ -0,0 +1,150 @@
+"""
+Locator definitions shared by the sync page objects in /test/pages and their async mirrors in /test/pages/aio
+
+Selectors are declared once per class with the strategy to build them, test ids and CSS are preferred over XPath
+as they are cheaper to evaluate. On the class a selector is the plain string of its strategy, e.g.
+page.get_by_test_id(GatewayService.port), on a page object it is the Locator built from it, once per page object,
+e.g. self.port.fill(port)
+"""
+
+
+class Selector(str):
+    """
+    A CSS selector, or any other selector accepted by page.locator
+    """
+    strategy = "css"
+
+    def __set_name__(self, owner, name):
+        self.attr_name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        # cached on the page object, it shadows this non-data descriptor from now on
+        locator = self.build(instance.page)
+        instance.__dict__[self.attr_name] = locator
+        return locator
+
+    def build(self, page):
+        return page.locator(str(self))
+
+
+class XPath(Selector):
+    strategy = "xpath"
+
+    def build(self, page):
+        return page.locator(f"xpath={self}")
+
+
+class DataTestId(Selector):
+    strategy = "test_id"
+
+    def build(self, page):
+        return page.get_by_test_id(str(self))
+
+
+class Placeholder(Selector):
+    strategy = "placeholder"
+
+    def build(self, page):
+        return page.get_by_placeholder(str(self), exact=True)
+
+
+class Label(Selector):
+    strategy = "label"
+
+    def build(self, page):
+        return page.get_by_label(str(self))
+
+
+def selectors(cls):
+    """
+    :return: the selectors declared on cls and its bases by attribute name
+    """
+    return {name: attr for klass in reversed(cls.__mro__) for name, attr in vars(klass).items()
+            if isinstance(attr, Selector)}
+
+
+class BasePageLocators:
+    list_rows = Selector("div > table > tbody > tr")
+    overflow_actions_button = Selector("[data-testid='overflow-actions-button']")
+    delete_action = Selector("li[data-testid='action-entity-delete'] > button")
+    confirmation_input = DataTestId("confirmation-input")
+    modal_action_button = DataTestId("modal-action-button")
+    # pagination of the entity lists, Kong Admin API pages by offset so a list only has next and previous buttons
+    pagination_next = DataTestId("next-button")
+    pagination_previous = DataTestId("previous-button")
+    page_size_dropdown = DataTestId("page-size-dropdown")
+    search_input = DataTestId("search-input")
+    page_sizes = (15, 30, 50, 75, 100)
+
+
+class GatewayServiceLocators:
+    list_container = Selector("div.kong-ui-entities-gateway-services-list")
+    new_gateway_service_button = DataTestId("new-gateway-service")
+    toolbar_add_button = DataTestId("toolbar-add-gateway-service")
+    name = Placeholder("Enter a unique name")
+    tags = Placeholder("Enter a list of tags separated by comma")
+    url = Placeholder("Enter a URL")
+    save = Selector("button[type='submit']")
+    alert_message = Selector(".alert-message")
+    separate_elements = Label("Protocol, Host, Port and Path")
+    protocol_select = DataTestId("gateway-service-protocol-select")
+    path = Placeholder("Enter a path")
+    host = Placeholder("Enter a host")
+    port = DataTestId("gateway-service-port-input")
+    view_advanced_fields = DataTestId("collapse-trigger-content")
+    tls_verify = DataTestId("gateway-service-tls-verify-checkbox")
+    # test ids of the protocol select items by protocol prefix, other protocols are tcp based
+    protocol_items = (
+        ("http", "select-item-http"),
+        ("grpc", "select-item-grpc"),
+        ("udp", "select-item-udp"),
+        ("ws", "select-item-websocket"),
+    )
+    tcp_protocol_item = "select-item-tcp"
+    # protocols that need a path
+    path_protocols = ("http", "ws")
+    # test ids of the advanced fields by the key of the input data
+    advanced_fields = {
+        "retries": "gateway-service-retries-input",
+        "connection_timeout": "gateway-service-connTimeout-input",
+        "write_timeout": "gateway-service-writeTimeout-input",
+        "read_timeout": "gateway-service-readTimeout-input",
+        "client_cert": "gateway-service-clientCert-input",
+        "ca_cert": "gateway-service-ca-certs-input",
+    }
+
+    @classmethod
+    def protocol_item(cls, protocol):
+        for prefix, test_id in cls.protocol_items:
+            if protocol.startswith(prefix):
+                return test_id
+        return cls.tcp_protocol_item
+
+
+class RouteLocators:
+    list_container = Selector("div.kong-ui-entities-routes-list")
+    new_route_button = DataTestId("new-route")
+    toolbar_add_button = DataTestId("toolbar-add-route")
+    name = Placeholder("Enter a unique name")
+    service = Placeholder("Select a service")
+    path = DataTestId("route-form-paths-input-1")
+    submit = DataTestId("form-submit")
+    footer_message = Selector("a[class='make-a-wish']")
+
+
+class LoginLocators:
+    username = Selector("#username")
+    password = Selector("#password")
+    submit = Selector("button[type='submit']")
+
+
+class WorkspaceLocators:
+    gateway_services_link = "Gateway Services"
+
+
+class WorkspacesLocators:
+    @staticmethod
+    def workspace(workspace_name):
+        return f"div.workspace-title[title='{workspace_name}'] > div.workspace-name"
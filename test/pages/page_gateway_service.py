@@ -1,144 +1,141 @@
+import time
+from collections.abc import Mapping
 from .base_page import BasePage
-from playwright.sync_api import expect, Page
+from .locators import GatewayServiceLocators
+from playwright.sync_api import Page
+from utils.action_timer import action_timer
 
 
-class GatewayService(BasePage):
-    name = "//input[@placeholder='Enter a unique name']"
-    tags = "//input[@placeholder='Enter a list of tags separated by comma']"
-    url = "//input[@placeholder='Enter a URL']"
-    save = "//button[@type='submit']"
-    alert_message = ".alert-message"
+class GatewayService(BasePage, GatewayServiceLocators):
 
     def __wait_for_list_to_be_visible(self):
-        self.exists(self.page.locator("//div[@class='kong-ui-entities-gateway-services-list']"))
+        self.exists(self.list_container)
+
+    def __wait_for_list_to_be_rendered(self):
+        # either the rows or the empty state are rendered once the list data arrives
+        rows = self.list_rows.first
+        self.exists(rows.or_(self.new_gateway_service_button))
 
     def goto_gateway_service(self, base_url, workspace_name="default"):
         url = f"{base_url}/{workspace_name}/services/"
-        self.page.goto(url)
+        with self.wait_for_api("services") as response_info:
+            self.page.goto(url, wait_until="commit")
         self.__wait_for_list_to_be_visible()
+        self.__wait_for_list_to_be_rendered()
+        return response_info.value
 
     def __click_add_gateway_service(self):
         self.__wait_for_list_to_be_visible()
-        count = self.page.get_by_test_id("new-gateway-service").count()
+        count = self.new_gateway_service_button.count()
         if count == 0:
-            self.page.get_by_test_id("toolbar-add-gateway-service").click()
+            self.toolbar_add_button.click()
         else:
-            self.page.get_by_test_id("new-gateway-service").click()
+            self.new_gateway_service_button.click()
 
     def delete_all_gateway_services(self, base_url, workspace_name="default"):
-        self.goto_gateway_service(base_url, workspace_name)
-        service_rows = "//div/table/tbody/tr"
-        count = self.page.locator(service_rows).count()
-        if count == 0:
-            return
-        for i in range(count - 1, -1, -1):
-            row = self.page.locator(service_rows).nth(i)
-            name = row.get_attribute("data-testid")
-            # click ...
-            row.locator("[data-testid='overflow-actions-button']").click()
-            # click Delete
-            row.locator("//li[@data-testid='action-entity-delete']/button").click()
-            # fill in name to confirm delete
-            self.page.locator("//input[@data-testid='confirmation-input']").fill(name)
-            # click "Yes, delete"
-            delete_button = self.page.locator("//button[@data-testid='modal-action-button']")
-            expect(delete_button).to_be_enabled(timeout=1000)
-            self.page.locator("//button[@data-testid='modal-action-button']").click()
+        """
+        Delete all gateway services of the workspace, in bulk through the Admin API if the page object has a client,
+        otherwise row by row through the UI
+        :return: number of deleted gateway services
+        """
+        if not self.admin_api:
+            return self.delete_all_rows(lambda: self.goto_gateway_service(base_url, workspace_name), "services")
+        gateway_services = self.admin_api.for_workspace(workspace_name).gateway_services
+        deleted = gateway_services.delete_all()
+        assert gateway_services.is_empty(), f"gateway services are left in workspace {workspace_name}"
+        return deleted
 
     def count_gateway_services(self, base_url, workspace_name="default"):
-        self.goto_gateway_service(base_url, workspace_name)
-        service_rows = "//div/table/tbody/tr"
-        return self.page.locator(service_rows).count()
+        return self.count_list_entities(self.goto_gateway_service(base_url, workspace_name), "services")
 
     def new_gateway_service(self, kwargs):
+        """
+        :return: the response of the Admin API request made by the form
+        """
         self.__click_add_gateway_service()
         self.__new_gateway_service_general_info(**kwargs)
         self.__new_gateway_service_endpoint(**kwargs)
         self.__new_gateway_service_advanced_fields(**kwargs)
-        self.page.locator(GatewayService.save).click()
-        self.page.wait_for_load_state("load")
+        with action_timer.measure("GatewayService.submit_gateway_service"):
+            with self.wait_for_api("services", "POST") as response_info:
+                self.submitted_at = time.perf_counter()
+                self.save.click()
+        response = response_info.value
+        if response.ok and self.ledger is not None:
+            self.ledger.record("services", response.json())
+        return response
 
     def __new_gateway_service_general_info(self, **kwargs):
         name = kwargs.get("name", None)
         if name:
-            self.page.locator(GatewayService.name).fill(name)
+            self.name.fill(name)
         tags = kwargs.get("tags", None)
         if tags:
-            self.page.locator(GatewayService.tags).fill(tags)
+            self.tags.fill(tags)
 
     def __new_gateway_service_endpoint(self, **kwargs):
         url = kwargs.get("url", None)
         if url:
-            # choose to use separate elements
-            self.page.locator(GatewayService.url).fill(url)
+            self.url.fill(url)
         else:
             # choose to use separate elements
-            self.page.get_by_label("Protocol, Host, Port and Path").check()
+            self.separate_elements.check()
             protocol = kwargs.get("protocol")
             path = kwargs.get("path", None)
-            self.page.get_by_test_id("gateway-service-protocol-select").click()
-            if protocol.startswith("http"):
-                self.page.get_by_test_id("select-item-http").get_by_role("button", name=protocol).click()
-                path_count = self.page.locator("//input[@placeholder='Enter a path']").count()
-                assert path_count != 0
-                self.page.locator("//input[@placeholder='Enter a path']").fill(path)
-            elif protocol.startswith("grpc"):
-                self.page.get_by_test_id("select-item-grpc").get_by_role("button", name=protocol).click()
-            elif protocol.startswith("udp"):
-                self.page.get_by_test_id("select-item-udp").get_by_role("button", name=protocol).click()
-            elif protocol.startswith("ws"):
-                self.page.get_by_test_id("select-item-websocket").get_by_role("button", name=protocol).click()
-                path_count = self.page.locator("//input[@placeholder='Enter a path']").count()
-                assert path_count != 0
-                self.page.locator("//input[@placeholder='Enter a path']").fill(path)
-            else:
-                self.page.get_by_test_id("select-item-tcp").get_by_role("button", name=protocol).click()
+            self.protocol_select.click()
+            item = self.page.get_by_test_id(GatewayService.protocol_item(protocol))
+            item.get_by_role("button", name=protocol).click()
+            if protocol.startswith(GatewayService.path_protocols):
+                path_input = self.path
+                assert path_input.count() != 0
+                path_input.fill(path)
             host = kwargs.get("host", None)
             port = kwargs.get("port", None)
-            self.page.locator("//input[@placeholder='Enter a host']").fill(host)
-            self.page.get_by_test_id("gateway-service-port-input").fill(port)
+            self.host.fill(host)
+            self.port.fill(port)
 
     def __new_gateway_service_advanced_fields(self, **kwargs):
         if kwargs:
-            btn_view_advanced_fields = self.page.locator("//button[@data-testid='collapse-trigger-content']")
-            btn_view_advanced_fields.click()
-        retries = kwargs.get("retries", None)
-        if retries:
-            self.page.get_by_test_id("gateway-service-retries-input").fill(retries)
-        connection_timeout = kwargs.get("connection_timeout", None)
-        if connection_timeout:
-            self.page.get_by_test_id("gateway-service-connTimeout-input").fill(connection_timeout)
-        write_timeout = kwargs.get("write_timeout", None)
-        if write_timeout:
-            self.page.get_by_test_id("gateway-service-writeTimeout-input").fill(write_timeout)
-        read_timeout = kwargs.get("read_timeout", None)
-        if read_timeout:
-            self.page.get_by_test_id("gateway-service-readTimeout-input").fill(read_timeout)
-        client_cert = kwargs.get("client_cert", None)
-        if client_cert:
-            self.page.get_by_test_id("gateway-service-clientCert-input").fill(client_cert)
-        ca_cert = kwargs.get("ca_cert", None)
-        if ca_cert:
-            self.page.get_by_test_id("gateway-service-ca-certs-input").fill(ca_cert)
+            self.view_advanced_fields.click()
+        for key, test_id in GatewayService.advanced_fields.items():
+            value = kwargs.get(key, None)
+            if value:
+                self.page.get_by_test_id(test_id).fill(value)
         tls_verify = kwargs.get("tls_verify")
         if tls_verify:
-            self.page.get_by_test_id("gateway-service-tls-verify-checkbox").check()
+            self.tls_verify.check()
 
 
-class ModelAddGatewayService:
+class ModelAddGatewayService(Mapping):
+    """
+    Input of GatewayService.new_gateway_service read from the test data, a record is a read-only mapping so that it
+    can be passed as kwargs, it is validated once by from_dict when the data file is loaded
+    """
+    __slots__ = (
+        "name", "tags", "url", "protocol", "host", "path", "port", "retries", "connection_timeout", "write_timeout",
+        "read_timeout", "client_cert", "ca_cert", "tls_verify"
+    )
+    # protocols of a gateway service in Kong
+    protocols = ("http", "https", "grpc", "grpcs", "tcp", "tls", "tls_passthrough", "udp", "ws", "wss")
+    # fields filled in text inputs, numbers are accepted and kept as strings
+    _numbers = ("port", "retries", "connection_timeout", "write_timeout", "read_timeout")
+
     def __init__(
             self,
             name,
-            tags,
-            url,
-            protocol,
-            host,
-            path,
-            port,
-            retries,
-            connection_timeout,
-            write_timeout,
-            read_timeout
+            tags=None,
+            url=None,
+            protocol=None,
+            host=None,
+            path=None,
+            port=None,
+            retries=None,
+            connection_timeout=None,
+            write_timeout=None,
+            read_timeout=None,
+            client_cert=None,
+            ca_cert=None,
+            tls_verify=None
     ):
         self.name = name
         self.tags = tags
@@ -151,3 +148,66 @@ class ModelAddGatewayService:
         self.connection_timeout = connection_timeout
         self.write_timeout = write_timeout
         self.read_timeout = read_timeout
+        self.client_cert = client_cert
+        self.ca_cert = ca_cert
+        self.tls_verify = tls_verify
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        :raise ValueError: if the data has unknown fields, wrong types or neither a url nor protocol and host
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"expected a mapping, got {type(data).__name__}")
+        unknown = set(data) - set(cls.__slots__)
+        if unknown:
+            raise ValueError(f"unknown fields {sorted(unknown)}")
+        data = dict(data)
+        for key in cls._numbers:
+            if isinstance(data.get(key), int) and not isinstance(data[key], bool):
+                data[key] = str(data[key])
+        for key in cls.__slots__:
+            value = data.get(key)
+            expected = bool if key == "tls_verify" else str
+            if value is not None and not isinstance(value, expected):
+                raise ValueError(f"{key} should be a {expected.__name__}, got {value!r}")
+            if key in cls._numbers and value is not None and not data[key].isdigit():
+                raise ValueError(f"{key} should be a number, got {value!r}")
+        if not data.get("name"):
+            raise ValueError("name is required")
+        if data.get("url"):
+            if data.get("protocol") or data.get("host"):
+                raise ValueError(f"{data['name']}: url and protocol/host are exclusive")
+        else:
+            if data.get("protocol") not in cls.protocols:
+                raise ValueError(f"{data['name']}: protocol should be one of {cls.protocols} without a url, "
+                                 f"got {data.get('protocol')!r}")
+            if not data.get("host"):
+                raise ValueError(f"{data['name']}: host is required without a url")
+        return cls(**data)
+
+    def to_admin_payload(self):
+        """
+        :return: the Admin API payload of the gateway service the form would create
+        """
+        payload = {"name": self.name, "url": self.url, "protocol": self.protocol, "host": self.host, "path": self.path,
+                   "tags": self.tags.split(",") if self.tags else None, "tls_verify": self.tls_verify}
+        for key, field in (("port", "port"), ("retries", "retries"), ("connect_timeout", "connection_timeout"),
+                           ("write_timeout", "write_timeout"), ("read_timeout", "read_timeout")):
+            value = getattr(self, field)
+            payload[key] = int(value) if value is not None else None
+        return {key: value for key, value in payload.items() if value is not None}
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name!r})"
@@ -0,0 +1,16 @@
+from .base_page import BasePage
+from .locators import LoginLocators
+
+
+class Login(BasePage, LoginLocators):
+
+    def is_login_page(self):
+        return "/login" in self.page.url
+
+    def login(self, base_url, username, password):
+        if not self.is_login_page():
+            self.page.goto(f"{base_url}/login")
+        self.username.fill(username)
+        self.password.fill(password)
+        self.submit.click()
+        self.page.wait_for_url(lambda url: "/login" not in url)
@@ -1,60 +1,68 @@
+import time
 from .base_page import BasePage
+from .locators import RouteLocators
 from utils.random_util import RandomUtil
-from playwright.sync_api import expect
+from utils.action_timer import action_timer
 
 
-class Route(BasePage):
-    footer_message = "a[class='make-a-wish']"
+class Route(BasePage, RouteLocators):
 
     def goto_routes(self, base_url, workspace_name="default"):
         url = f"{base_url}/{workspace_name}/routes/"
-        self.page.goto(url)
+        with self.wait_for_api("routes") as response_info:
+            self.page.goto(url, wait_until="commit")
         self.__wait_for_list_to_be_visible()
+        self.__wait_for_list_to_be_rendered()
+        return response_info.value
 
     def __wait_for_list_to_be_visible(self):
-        self.exists(self.page.locator("//div[@class='kong-ui-entities-routes-list']"))
+        self.exists(self.list_container)
+
+    def __wait_for_list_to_be_rendered(self):
+        # either the rows or the empty state are rendered once the list data arrives
+        rows = self.list_rows.first
+        self.exists(rows.or_(self.new_route_button))
 
     def __click_new_route(self):
         self.__wait_for_list_to_be_visible()
-        buttons = self.page.locator("[data-testid='new-route']")
+        buttons = self.new_route_button
         if buttons.count() == 0:
-            self.page.get_by_test_id("toolbar-add-route").click()
+            self.toolbar_add_button.click()
         else:
-            self.page.get_by_test_id("new-route").click()
-        self.page.wait_for_load_state("load")
+            buttons.click()
 
     def new_route(self, service_name, path="/", **kwargs):
+        """
+        :return: the response of the Admin API request made by the form
+        """
         self.__click_new_route()
-        self.page.get_by_placeholder("Enter a unique name").fill(f"route_{RandomUtil.timestamp()}")
-        self.page.get_by_placeholder("Select a service").click()
+        self.name.fill(RandomUtil.unique_name("route"))
+        self.service.click()
         self.page.get_by_text(service_name).click()
-        self.page.get_by_test_id("route-form-paths-input-1").fill(path)
-        self.page.get_by_test_id("form-submit").click()
-        self.exists(self.page.locator(Route.footer_message))
+        self.path.fill(path)
+        with action_timer.measure("Route.submit_route"):
+            with self.wait_for_api("routes", "POST") as response_info:
+                self.submitted_at = time.perf_counter()
+                self.submit.click()
+            self.exists(self.footer_message)
+        response = response_info.value
+        if response.ok and self.ledger is not None:
+            self.ledger.record("routes", response.json())
+        return response
 
     def delete_all_routes(self, base_url, workspace_name="default"):
-        self.goto_routes(base_url, workspace_name)
-        rows = "//div/table/tbody/tr"
-        count = self.page.locator(rows).count()
-        if count == 0:
-            return
-        for i in range(count - 1, -1, -1):
-            row = self.page.locator(rows).nth(i)
-            name = row.get_attribute("data-testid")
-            # click ...
-            row.locator("[data-testid='overflow-actions-button']").click()
-            # click Delete
-            row.locator("//li[@data-testid='action-entity-delete']/button").click()
-            # fill in name to confirm delete
-            self.page.locator("//input[@data-testid='confirmation-input']").fill(name)
-            # click "Yes, delete"
-            # self.page.wait_for_load_state("load")
-            delete_button = self.page.locator("//button[@data-testid='modal-action-button']")
-            expect(delete_button).to_be_enabled(timeout=1000)
-            self.page.locator("//button[@data-testid='modal-action-button']").click()
+        """
+        Delete all routes of the workspace, in bulk through the Admin API if the page object has a client,
+        otherwise row by row through the UI
+        :return: number of deleted routes
+        """
+        if not self.admin_api:
             self.page.on("dialog", self.handle_dialog)
+            return self.delete_all_rows(lambda: self.goto_routes(base_url, workspace_name), "routes")
+        routes = self.admin_api.for_workspace(workspace_name).routes
+        deleted = routes.delete_all()
+        assert routes.is_empty(), f"routes are left in workspace {workspace_name}"
+        return deleted
 
     def count_route(self, base_url, workspace_name="default"):
-        self.goto_routes(base_url, workspace_name)
-        service_rows = "//div/table/tbody/tr"
-        return self.page.locator(service_rows).count()
+        return self.count_list_entities(self.goto_routes(base_url, workspace_name), "routes")
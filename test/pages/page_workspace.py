@@ -1,11 +1,12 @@
 from .base_page import BasePage
+from .locators import WorkspaceLocators
 
 
-class Workspace(BasePage):
+class Workspace(BasePage, WorkspaceLocators):
 
     def goto_workspace(self, base_url, workspace_name):
         url = f"{base_url}/{workspace_name}/overview/"
         self.page.goto(url)
 
     def click_gateway_services(self):
-        self.page.get_by_role("link", name="Gateway Services").click()
+        self.page.get_by_role("link", name=Workspace.gateway_services_link).click()
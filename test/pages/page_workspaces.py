@@ -1,9 +1,9 @@
 from .base_page import BasePage
+from .locators import WorkspacesLocators
 
 
-class Workspaces(BasePage):
+class Workspaces(BasePage, WorkspacesLocators):
 
     def go_to_workspace(self, base_url, workpace_name):
         self.page.goto(base_url)
-        workspace = f"//div[@title='{workpace_name}' and @class='workspace-title']/div[@class='workspace-name']"
-        self.page.locator(workspace).click()
+        self.page.locator(Workspaces.workspace(workpace_name)).click()
@@ -1,16 +1,42 @@
 from .base_verifier import BaseVerifier
 import pytest
 from playwright.sync_api import Page
+from apis.admin_api import AdminApi
+from pages.page_gateway_service import GatewayService
+from pages.page_route import Route
+from utils.entity_ledger import EntityLedger
 
 
 class UIBaseTest:
     base_url: str
     page: Page
     verifier: BaseVerifier
+    admin_api: AdminApi
+    workspace_name: str
+    ledger: EntityLedger
 
     @pytest.fixture(autouse=True, scope='function')
-    def init_url_page(self, env_config, page):
+    def init_url_page(self, env_config, page, admin_api, workspace_name, entity_ledger):
         self.base_url = env_config.url
         self.page = page
+        self.admin_api = admin_api
+        self.workspace_name = workspace_name
+        self.ledger = entity_ledger
         self.verifier = BaseVerifier()
         yield
+
+    def purge_gateway_entities(self):
+        """
+        Delete all routes and gateway services before a test through the UI. If the env exposes the Admin API there
+        is nothing to do: it relies on the purge of the workspace at the start of the session, on kong_state restoring
+        the clean snapshot after every class and on the entity ledger deleting the entities of each test
+        """
+        if self.admin_api:
+            return
+        Route(self.page).delete_all_routes(self.base_url, self.workspace_name)
+        GatewayService(self.page).delete_all_gateway_services(self.base_url, self.workspace_name)
+
+    def count_gateway_services(self):
+        if self.admin_api:
+            return self.admin_api.gateway_services.count()
+        return GatewayService(self.page).count_gateway_services(self.base_url, self.workspace_name)
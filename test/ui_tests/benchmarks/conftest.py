@@ -0,0 +1,62 @@
+import os
+import pytest
+from contextlib import contextmanager
+from utils.benchmark import Benchmark
+from utils.data_generator import DataGenerator
+
+benchmark_dir = os.path.dirname(__file__)
+root_dir = os.path.dirname(os.path.dirname(os.path.dirname(benchmark_dir)))
+entity_counts = [int(count) for count in os.getenv("BENCHMARK_COUNTS", "10,1000,10000").split(",")]
+scaling_counts = [int(count) for count in os.getenv("SCALING_COUNTS", "1000,10000,50000").split(",")]
+
+
+@pytest.fixture(scope='session')
+def benchmark(env_config):
+    """
+    Benchmark of the run, the environment variable BENCHMARK sets its mode: record or compare
+    """
+    mode = os.getenv("BENCHMARK")
+    baseline_path = os.path.join(benchmark_dir, "baselines", f"{env_config.env_name}.json")
+    benchmark = Benchmark(baseline_path, mode, float(os.getenv("BENCHMARK_THRESHOLD", "0.2")))
+    yield benchmark
+    benchmark.save(os.path.join(root_dir, "reports", "benchmark_results.json"))
+
+
+@contextmanager
+def _seeded(admin_api, entity_baseline, count):
+    """
+    Seed gateway services and one route per service through the Admin API, they are added to the entity baseline
+    so that the leak check of a failed benchmark keeps them
+    """
+    if not admin_api:
+        pytest.skip("benchmarks seed entities through the Admin API, admin_url is not set")
+    admin_api.purge()
+    generator = DataGenerator(prefix="bench")
+    services = admin_api.gateway_services.create_many(
+        service.to_admin_payload() for service in generator.gateway_services(count, protocols=("http",)))
+    routes = admin_api.routes.create_many(generator.routes(services))
+    entity_baseline["services"].update(service["id"] for service in services)
+    entity_baseline["routes"].update(route["id"] for route in routes)
+    yield
+    admin_api.purge()
+    entity_baseline["services"].clear()
+    entity_baseline["routes"].clear()
+
+
+@pytest.fixture(scope='module', params=entity_counts, ids=lambda count: f"{count}_entities")
+def seeded_entities(request, benchmark, admin_api, entity_baseline):
+    """
+    :return: the number of seeded gateway services, each with a route
+    """
+    with _seeded(admin_api, entity_baseline, request.param):
+        yield request.param
+
+
+@pytest.fixture(scope='module', params=scaling_counts, ids=lambda count: f"{count}_entities")
+def scaled_entities(request, benchmark, admin_api, entity_baseline):
+    """
+    Larger seeds for the list scaling benchmarks, SCALING_COUNTS overrides the counts
+    :return: the number of seeded gateway services, each with a route
+    """
+    with _seeded(admin_api, entity_baseline, request.param):
+        yield request.param
@@ -0,0 +1,63 @@
+import os
+import time
+import pytest
+from pages.page_gateway_service import GatewayService
+from pages.page_route import Route
+from ui_tests.base_test.ui_base_test import UIBaseTest
+from utils.action_timer import summarize
+from utils.propagation import PropagationProbe
+from utils.random_util import RandomUtil
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not os.getenv("BENCHMARK"), reason="set BENCHMARK=record|compare to run benchmarks")
+class TestConfigPropagationBenchmark(UIBaseTest):
+    """
+    Latency from a configuration change to the proxy serving it: a route created through the forms, then updated and
+    deleted through the Admin API. PROPAGATION_BUDGET_MS is the budget of the p95 of each change
+    """
+    repeat = int(os.getenv("BENCHMARK_REPEAT", "5"))
+    budget = float(os.getenv("PROPAGATION_BUDGET_MS", "6000"))
+
+    @pytest.fixture(autouse=True, scope='function')
+    def setup_teardown_method(self, init_url_page, env_config, proxy_url, upstream_server, benchmark):
+        if not self.admin_api or not proxy_url:
+            pytest.skip(f"env {env_config.env_name} exposes no Admin API or proxy")
+        self.upstream_url = upstream_server.url_for(env_config.upstream_host)
+        self.benchmark = benchmark
+        self.gateway_service = GatewayService(self.page, ledger=self.ledger)
+        self.route = Route(self.page, ledger=self.ledger)
+        self.probe = PropagationProbe(proxy_url)
+        yield
+        self.probe.close()
+
+    def _verify(self, metric, samples):
+        self.benchmark.add(metric, samples)
+        within_threshold, message = self.benchmark.check(metric)
+        self.verifier.verify_true(within_threshold, message)
+        p95 = summarize(samples)["p95"]
+        self.verifier.verify_true(p95 <= self.budget, f"{metric} p95={p95}ms, budget={self.budget}ms")
+
+    def test_route_propagation(self):
+        created, updated, deleted = [], [], []
+        for _ in range(self.repeat):
+            name = RandomUtil.unique_name("propagation")
+            self.gateway_service.goto_gateway_service(self.base_url, self.workspace_name)
+            self.gateway_service.new_gateway_service({"name": name, "url": self.upstream_url})
+            self.route.goto_routes(self.base_url, self.workspace_name)
+            route = self.route.new_route(name, f"/{name}").json()
+            created.append(self.probe.wait_until_served(f"/{name}", self.route.submitted_at, "create"))
+
+            # Kong matches paths by prefix, the new path must not start with the old one to be served only once
+            # the update has propagated, which is also when the old path stops being served
+            since = time.perf_counter()
+            self.admin_api.routes.update(route["id"], {"paths": [f"/updated-{name}"]})
+            self.probe.wait_until_served(f"/updated-{name}", since, "update.served")
+            updated.append(self.probe.wait_until_gone(f"/{name}", since, "update"))
+
+            since = time.perf_counter()
+            self.admin_api.routes.delete(route["id"])
+            deleted.append(self.probe.wait_until_gone(f"/updated-{name}", since, "delete"))
+        self._verify("propagation.create", created)
+        self._verify("propagation.update", updated)
+        self._verify("propagation.delete", deleted)
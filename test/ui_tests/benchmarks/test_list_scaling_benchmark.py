@@ -0,0 +1,64 @@
+import os
+import time
+import pytest
+from pages.base_page import BasePage
+from pages.page_gateway_service import GatewayService
+from pages.page_route import Route
+from ui_tests.base_test.ui_base_test import UIBaseTest
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not os.getenv("BENCHMARK"), reason="set BENCHMARK=record|compare to run benchmarks")
+class TestListScalingBenchmark(UIBaseTest):
+    """
+    How the entity lists of Kong Manager scale with 1k, 10k and 50k entities: rendering of the first page,
+    paging to the next page and searching an entity by name
+    """
+    repeat = int(os.getenv("BENCHMARK_REPEAT", "5"))
+
+    @pytest.fixture(autouse=True, scope='function')
+    def setup_teardown_method(self, init_url_page, benchmark, scaled_entities):
+        self.benchmark = benchmark
+        self.entity_count = scaled_entities
+        self.gateway_service = GatewayService(self.page, ledger=self.ledger)
+        self.route = Route(self.page, ledger=self.ledger)
+        yield
+
+    def _verify(self, metric, samples):
+        self.benchmark.add(metric, samples)
+        within_threshold, message = self.benchmark.check(metric)
+        self.verifier.verify_true(within_threshold, message)
+
+    def _benchmark_list(self, name, page_object: BasePage, goto_list, entity, search_name):
+        render, paging, search = [], [], []
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            response = goto_list()
+            render.append((time.perf_counter() - start) * 1000)
+            # the rows only show the first page of the list
+            self.verifier.verify_equals(page_object.list_rows.count(), len(response.json()["data"]))
+
+            start = time.perf_counter()
+            page_object.next_page(entity)
+            paging.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            page_object.search(entity, search_name)
+            self.page.locator(f"{BasePage.list_rows}[data-testid='{search_name}']").wait_for()
+            search.append((time.perf_counter() - start) * 1000)
+        self._verify(f"{name}.list_render[{self.entity_count}]", render)
+        self._verify(f"{name}.next_page[{self.entity_count}]", paging)
+        self._verify(f"{name}.search[{self.entity_count}]", search)
+
+    def test_gateway_services_list_scaling(self):
+        (service,), _ = self.admin_api.gateway_services.list(size=1)
+        self._benchmark_list(
+            "gateway_services", self.gateway_service,
+            lambda: self.gateway_service.goto_gateway_service(self.base_url, self.workspace_name),
+            "services", service["name"])
+
+    def test_routes_list_scaling(self):
+        (route,), _ = self.admin_api.routes.list(size=1)
+        self._benchmark_list(
+            "routes", self.route, lambda: self.route.goto_routes(self.base_url, self.workspace_name),
+            "routes", route["name"])
@@ -0,0 +1,82 @@
+import os
+import time
+import pytest
+from pages.page_gateway_service import GatewayService
+from pages.page_route import Route
+from pages.locators import Selector, XPath, DataTestId
+from ui_tests.base_test.ui_base_test import UIBaseTest
+from utils.action_timer import action_timer
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not os.getenv("BENCHMARK"), reason="set BENCHMARK=record|compare to run benchmarks")
+class TestPageLoadBenchmark(UIBaseTest):
+    repeat = int(os.getenv("BENCHMARK_REPEAT", "5"))
+
+    @pytest.fixture(autouse=True, scope='function')
+    def setup_teardown_method(self, init_url_page, benchmark, seeded_entities):
+        self.benchmark = benchmark
+        self.entity_count = seeded_entities
+        self.gateway_service = GatewayService(self.page, ledger=self.ledger)
+        self.route = Route(self.page, ledger=self.ledger)
+        yield
+
+    def _navigation_timing(self):
+        """
+        :return: navigation timing of the current document, in ms from the start of the navigation
+        """
+        return self.page.evaluate("() => performance.getEntriesByType('navigation')[0].toJSON()")
+
+    def _benchmark_list(self, name, goto_list):
+        list_visible = []
+        dom_content_loaded = []
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            goto_list()
+            list_visible.append((time.perf_counter() - start) * 1000)
+            timing = self._navigation_timing()
+            dom_content_loaded.append(timing["domContentLoadedEventEnd"] - timing["startTime"])
+        self._verify(f"{name}.dom_content_loaded[{self.entity_count}]", dom_content_loaded)
+        self._verify(f"{name}.list_visible[{self.entity_count}]", list_visible)
+
+    def _verify(self, metric, samples):
+        self.benchmark.add(metric, samples)
+        within_threshold, message = self.benchmark.check(metric)
+        self.verifier.verify_true(within_threshold, message)
+
+    def test_gateway_services_list(self):
+        self._benchmark_list(
+            "gateway_services", lambda: self.gateway_service.goto_gateway_service(self.base_url, self.workspace_name))
+
+    def test_routes_list(self):
+        self._benchmark_list("routes", lambda: self.route.goto_routes(self.base_url, self.workspace_name))
+
+    def test_gateway_service_form_submit(self):
+        # the created gateway services are deleted by the entity ledger
+        for i in range(self.repeat):
+            self.gateway_service.goto_gateway_service(self.base_url, self.workspace_name)
+            self.gateway_service.new_gateway_service({"name": f"bench-new-{i}", "url": "http://kim.org"})
+        self._verify(f"gateway_service.form_submit[{self.entity_count}]",
+                     action_timer.samples("GatewayService.submit_gateway_service"))
+
+    def test_selector_strategies(self):
+        """
+        Cost of evaluating the same elements of the gateway services list with each selector strategy
+        """
+        self.gateway_service.goto_gateway_service(self.base_url, self.workspace_name)
+        # the list of Manager pages the Admin API in the same order, the first service is on the first page
+        (service,), _ = self.admin_api.gateway_services.list(size=1)
+        first_row = service["name"]
+        strategies = {
+            "list_rows.css": Selector(GatewayService.list_rows),
+            "list_rows.xpath": XPath("//div/table/tbody/tr"),
+            "row.test_id": DataTestId(first_row),
+            "row.css": Selector(f"tr[data-testid='{first_row}']"),
+            "row.xpath": XPath(f"//tr[@data-testid='{first_row}']"),
+        }
+        for strategy, selector in strategies.items():
+            locator = selector.build(self.page)
+            if strategy.startswith("row."):
+                # a selector matching nothing would time nothing
+                self.verifier.verify_equals(locator.count(), 1, f"{strategy} should match the row of {first_row}")
+            self._verify(f"selector.{strategy}[{self.entity_count}]", self.benchmark.time(locator.count, self.repeat))
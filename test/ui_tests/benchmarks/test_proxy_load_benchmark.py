@@ -0,0 +1,51 @@
+import os
+import pytest
+from ui_tests.base_test.base_verifier import BaseVerifier
+from utils.load_generator import ProxyLoadGenerator
+from utils.random_util import RandomUtil
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not os.getenv("BENCHMARK"), reason="set BENCHMARK=record|compare to run benchmarks")
+class TestProxyLoadBenchmark:
+    """
+    Load on the Kong proxy through routes created by fixtures, the upstreams are served by this worker so that only
+    Kong is measured. PROXY_RPS, PROXY_DURATION and PROXY_P99_BUDGET_MS set the load and its latency budget
+    """
+    rps = int(os.getenv("PROXY_RPS", "200"))
+    duration = float(os.getenv("PROXY_DURATION", "10"))
+    p99_budget = float(os.getenv("PROXY_P99_BUDGET_MS", "50"))
+    route_count = 2
+
+    @pytest.fixture(autouse=True, scope='function')
+    def setup_teardown_method(self, env_config, admin_api, proxy_url, upstream_server, entity_ledger, benchmark):
+        if not admin_api or not proxy_url:
+            pytest.skip(f"env {env_config.env_name} exposes no Admin API or proxy")
+        self.admin_api = admin_api
+        self.proxy_url = proxy_url
+        self.upstream_url = upstream_server.url_for(env_config.upstream_host)
+        self.ledger = entity_ledger
+        self.benchmark = benchmark
+        self.verifier = BaseVerifier()
+        yield
+
+    def _new_route(self, name):
+        """
+        :return: the request path of a new route of a new gateway service pointing at the upstream
+        """
+        service = self.admin_api.gateway_services.new_gateway_service(name, url=self.upstream_url)
+        self.ledger.record("services", service)
+        self.ledger.record("routes", self.admin_api.routes.new_route(name, service["id"], paths=[f"/{name}"]))
+        return f"/{name}"
+
+    def test_proxy_load(self):
+        routes = {f"route{i}": self._new_route(RandomUtil.unique_name("load")) for i in range(self.route_count)}
+        report = ProxyLoadGenerator(self.proxy_url, self.rps, self.duration).run_sync(routes)
+        for name in routes:
+            metric = f"proxy.{name}.latency[{self.rps}rps]"
+            self.benchmark.add(metric, report.samples.get(name, []) or [float("inf")])
+            within_threshold, message = self.benchmark.check(metric)
+            self.verifier.verify_true(within_threshold, message)
+        # each route gets its share of the target rate, within 10%
+        min_throughput = 0.9 * self.rps / self.route_count
+        self.verifier.verify_equals(report.violations(self.p99_budget, min_throughput), [])
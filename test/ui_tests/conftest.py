@@ -1,41 +1,403 @@
 import pytest
 import os
+import time
 from env_config.env_config import EnvConfig
-from playwright.sync_api import sync_playwright
+from apis.admin_api import AdminApi
+from apis.base_api import AdminApiError
+from anyio.from_thread import start_blocking_portal
+from utils.browser_pool import BrowserPool
+from utils.async_browser_pool import AsyncBrowserPool
+from utils.trace_recorder import TraceRecorder
+from utils.asset_cache import AssetCache
+from utils.auth_state import AuthState
+from pages.page_login import Login
+from pages.page_workspace import Workspace
+from pages.page_workspaces import Workspaces
+from pages.page_gateway_service import GatewayService
+from pages.page_route import Route
+from utils.action_timer import action_timer
+from utils.entity_ledger import EntityLedger
+from utils.db_snapshot import PostgresSnapshots, StandInSnapshots
+from utils.data_generator import DataGenerator
+from utils.health_gate import HealthGate, HealthGateError, http_check, kong_status_check, manager_check, \
+    postgres_check
+from utils.log_util import logger
+from mock_server.kong_admin import KongAdminMockServer
+from mock_server.upstream import UpstreamMockServer
+
+root_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    # keep reports of setup/call on the item, so that fixtures can tell whether the test failed at teardown
+    setattr(item, f"rep_{report.when}", report)
+
+
+def _failed(node):
+    reports = [getattr(node, f"rep_{when}", None) for when in ("setup", "call")]
+    return any(report and report.failed for report in reports)
 
 
 @pytest.fixture(scope='session', autouse=True)
 def env_config():
-    if not os.getenv("ENV_NAME"):
-        env_name = "local"
+    env_name = os.getenv("ENV_NAME", "local")
     env_config = EnvConfig(env_name)
     yield env_config
 
 
-@pytest.fixture(scope="class")
-def page(env_config):
-    with sync_playwright() as pw:
-        mode = env_config.mode
-        if mode == "headless" or os.getenv("GITHUB_RUN"):
-            headless = True
-        else:
-            headless = False
-        if env_config.browser == "chromium":
-            browser = pw.chromium.launch(headless=headless, args=["--no-sandbox", "--no-zygote"])
-        elif env_config.browser == "firefox":
-            browser = pw.firefox.launch(headless=headless)
+@pytest.fixture(scope='session', autouse=True)
+def health_gate(env_config):
+    """
+    Wait for Kong Admin API, Kong Manager, the proxy and Postgres to be healthy before the first test, they are polled
+    with exponential backoff while the containers start, the session stops with the state of each of them if one is
+    still down at the deadline
+    """
+    if env_config.hermetic or not env_config.health_gate:
+        return
+    gate = HealthGate(timeout=env_config.health_gate_timeout)
+    if env_config.admin_url:
+        gate.add("admin_api", kong_status_check(env_config.admin_url))
+    gate.add("manager", manager_check(env_config.url))
+    if env_config.proxy_url:
+        # any answer of the proxy will do, 404 included
+        gate.add("proxy", http_check(env_config.proxy_url, ok=lambda response: True))
+    if env_config.postgres:
+        gate.add("postgres", postgres_check(env_config.postgres))
+    try:
+        gate.wait()
+    except HealthGateError as e:
+        pytest.exit(f"health gate of env {env_config.env_name} failed, {e}", returncode=pytest.ExitCode.TESTS_FAILED)
+
+
+@pytest.fixture(scope='session', autouse=True)
+def action_timing_report():
+    """
+    Time page-object actions and Playwright calls, the report is written to reports/ at the end of the session
+    """
+    action_timer.instrument_playwright()
+    yield
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    file_name = f"action_timings-{worker}.json" if worker else "action_timings.json"
+    action_timer.dump(os.path.join(root_dir, "reports", file_name))
+
+
+@pytest.fixture(scope='function', autouse=True)
+def action_timing(request, action_timing_report):
+    action_timer.start_test(request.node.nodeid)
+    yield
+    action_timer.attach(action_timer.stop_test())
+
+
+@pytest.fixture(scope='session')
+def admin_stand_in(env_config):
+    """
+    In-process stand-in of the Kong Admin API in hermetic mode, None otherwise
+    """
+    if not env_config.hermetic:
+        yield None
+        return
+    with KongAdminMockServer() as server:
+        logger.info(f"hermetic mode, Kong Admin API served in-process at {server.url}")
+        yield server
+
+
+@pytest.fixture(scope='session')
+def admin_url(env_config, admin_stand_in):
+    """
+    Url of the Kong Admin API, in hermetic mode it is served by an in-process stand-in so that the fixtures run
+    without any container, None if the env does not expose the Admin API
+    """
+    return admin_stand_in.url if admin_stand_in else env_config.admin_url
+
+
+@pytest.fixture(scope='session')
+def workspace_name(admin_url, env_config):
+    """
+    Tests run in the default workspace, when running in parallel with pytest-xdist each worker owns a workspace
+    created for this run, so that workers don't wipe each other's entities
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if not worker:
+        yield "default"
+        return
+    if not admin_url:
+        pytest.fail(f"parallel run needs admin_url of env {env_config.env_name} to create a workspace per worker")
+    run_id = os.getenv("PYTEST_XDIST_TESTRUNUID", "")[:8]
+    name = f"autotest-{run_id}-{worker}"
+    with AdminApi(admin_url) as root_api:
+        root_api.workspaces.new_workspace(name)
+        yield name
+        root_api.for_workspace(name).purge()
+        root_api.workspaces.delete(name)
+
+
+@pytest.fixture(scope='session')
+def admin_api(admin_url, workspace_name):
+    """
+    Kong Admin API client of the workspace under test, None if the env does not expose the Admin API
+    """
+    if not admin_url:
+        yield None
+        return
+    with AdminApi(admin_url, workspace_name) as admin_api:
+        yield admin_api
+
+
+@pytest.fixture(scope='session')
+def proxy_url(env_config):
+    """
+    Url of the Kong proxy, None if the env does not expose it or in hermetic mode
+    """
+    return None if env_config.hermetic else env_config.proxy_url
+
+
+@pytest.fixture(scope='session')
+def upstream_server(env_config):
+    """
+    Upstream of the gateway services of proxy tests, served by this worker, services reach it at
+    upstream_server.url_for(env_config.upstream_host)
+    """
+    with UpstreamMockServer("0.0.0.0") as server:
+        yield server
+
+
+@pytest.fixture(scope='session')
+def entity_baseline(admin_api):
+    """
+    Ids of the gateway entities of the workspace under test after a purge at the start of the session,
+    fixtures seeding entities for several tests add them here so that the leak check keeps them
+    """
+    if not admin_api:
+        yield None
+        return
+    admin_api.purge()
+    yield EntityLedger.snapshot(admin_api)
+
+
+def _preseed(admin_api):
+    generator = DataGenerator(prefix="preseeded")
+    services = admin_api.gateway_services.create_many(
+        service.to_admin_payload() for service in
+        generator.gateway_services(int(os.getenv("KONG_STATE_SEED_COUNT", "100")), protocols=("http",)))
+    admin_api.routes.create_many(generator.routes(services))
+
+
+# snapshots other than clean, built from the clean one by their seeder the first time a class asks for them
+kong_state_seeders = {"preseeded": _preseed}
+
+
+@pytest.fixture(scope='session')
+def db_snapshots(env_config, admin_stand_in, admin_api, entity_baseline):
+    """
+    Snapshots of the state of Kong restored by kong_state, "clean" is the purged workspace at the start of the
+    session. They are kept by the stand-in in hermetic mode, as template databases of the Kong database otherwise.
+    None if the env has neither, if docker can't run psql in the database container, or under pytest-xdist since the
+    Kong database is shared by the workers
+    """
+    if admin_stand_in:
+        snapshots = StandInSnapshots(admin_stand_in.store)
+    elif env_config.db_container and admin_api and not os.getenv("PYTEST_XDIST_WORKER"):
+        snapshots = PostgresSnapshots(env_config.db_container, admin_api)
+        try:
+            snapshots.check()
+        except RuntimeError as e:
+            logger.warning(f"kong_state snapshots are disabled, the classes marked with kong_state are skipped: {e}")
+            yield None
+            return
+    else:
+        yield None
+        return
+    snapshots.take("clean")
+    yield snapshots
+    snapshots.restore("clean")
+    snapshots.drop_all()
+
+
+@pytest.fixture(scope='class', autouse=True)
+def kong_state(request, env_config, db_snapshots, admin_api):
+    """
+    Restore the clean snapshot after every class, so that classes don't depend on what ran before them.
+    @pytest.mark.kong_state("preseeded") starts the class from the preseeded snapshot instead, KONG_STATE_SEED_COUNT
+    gateway services with a route each. Unmarked classes aren't restored before they start, so that module fixtures
+    seeding entities for them keep their seeds
+    :return: ids of the entities of the snapshot the class started from by entity, the leak check of its tests keeps
+    them. None for unmarked classes
+    """
+    marker = request.node.get_closest_marker("kong_state")
+    if db_snapshots is None:
+        if marker:
+            if os.getenv("PYTEST_XDIST_WORKER"):
+                pytest.fail("kong_state restores the whole Kong database, which is shared by the workers, run the "
+                            "classes marked with it without pytest-xdist")
+            pytest.skip(f"env {env_config.env_name} has no Kong database to snapshot")
+        yield None
+        return
+    baseline = None
+    if marker:
+        name = marker.args[0]
+        if name in db_snapshots:
+            db_snapshots.restore(name)
+        elif name in kong_state_seeders:
+            db_snapshots.restore("clean")
+            kong_state_seeders[name](admin_api)
+            db_snapshots.take(name)
         else:
-            browser = pw.webkit.launch(headless=headless)
-        permissions = ["clipboard-read", "clipboard-write"]
-        context = browser.new_context(permissions=permissions)
-        # 录制日志
-        context.tracing.start(screenshots=True, snapshots=True, sources=True)
-        context.set_default_timeout(10 * 1000)
+            pytest.fail(f"unknown kong_state {name}, expected clean or one of {sorted(kong_state_seeders)}")
+        baseline = EntityLedger.snapshot(admin_api)
+    yield baseline
+    db_snapshots.restore("clean")
+
+
+@pytest.fixture(scope='function')
+def entity_ledger(request, admin_api, entity_baseline, kong_state):
+    """
+    Ledger of the gateway entities created by the test, they are deleted at teardown. When the test failed or the
+    ledger could not be purged, entities may have been created without being recorded, so the workspace is diffed
+    against the baseline, the one of the snapshot the class started from if any, to delete leaks
+    """
+    ledger = EntityLedger()
+    yield ledger
+    if not admin_api:
+        return
+    leak_check = _failed(request.node)
+    try:
+        ledger.purge(admin_api)
+    except AdminApiError as e:
+        logger.warning(f"failed to purge the entity ledger of {request.node.nodeid}: {e}")
+        leak_check = True
+    if leak_check:
+        EntityLedger.purge_leaks(admin_api, kong_state if kong_state is not None else entity_baseline)
+
+
+@pytest.fixture(scope='session')
+def browser_pool(env_config, playwright):
+    """
+    Browsers are launched once per session (per worker when running in parallel) instead of once per class
+    """
+    if env_config.hermetic:
+        pytest.skip("Kong Manager is not available in hermetic mode")
+    pool = BrowserPool(playwright)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope='session')
+def async_browser_pool(env_config):
+    """
+    Async browsers for the page objects in /test/pages/aio, they run on the event loop of a background thread
+    of this worker and are launched on first use
+    """
+    if env_config.hermetic:
+        pytest.skip("Kong Manager is not available in hermetic mode")
+    with start_blocking_portal() as portal:
+        pool = AsyncBrowserPool(portal)
+        yield pool
+        pool.run(pool.close)
+
+
+@pytest.fixture(scope='session')
+def trace_recorder(env_config):
+    recorder = TraceRecorder(root_dir, env_config.trace_retention, os.getenv("PYTEST_XDIST_TESTRUNUID"))
+    yield recorder
+    recorder.close()
+
+
+@pytest.fixture(scope='session')
+def asset_cache(env_config):
+    """
+    Opt-in cache of Kong Manager static assets shared by all contexts, None if disabled
+    """
+    if not env_config.asset_cache and not env_config.block_telemetry:
+        yield None
+        return
+    cache = AssetCache(cache_assets=env_config.asset_cache, block_telemetry=env_config.block_telemetry)
+    yield cache
+    cache.log_stats()
+
+
+@pytest.fixture(scope='session')
+def auth_state(env_config, browser_pool, workspace_name):
+    """
+    Storage state of a logged-in Kong Manager session reused by all contexts, None if the env doesn't need a login
+    """
+    if not env_config.username:
+        yield None
+        return
+    auth_state = AuthState(os.path.join(root_dir, ".auth"), env_config.env_name,
+                           env_config.username, env_config.password)
+    if not auth_state.is_fresh():
+        context = browser_pool.new_context(env_config.browser, env_config.headless)
+        auth_state.login(context.new_page(), env_config.url, workspace_name)
+        context.close()
+    yield auth_state
+
+
+@pytest.fixture(scope='session')
+def validated_locators(env_config, browser_pool):
+    """
+    The selectors of all page objects are evaluated once per session on a blank page, so that a malformed selector
+    fails the session at start-up instead of timing out in the middle of a test
+    """
+    context = browser_pool.new_context(env_config.browser, env_config.headless)
+    try:
         page = context.new_page()
+        for page_class in (GatewayService, Route, Login, Workspace, Workspaces):
+            page_class(page).validate_locators()
+    finally:
+        context.close()
+
+
+@pytest.fixture(scope='session')
+def manager_warmup(env_config, browser_pool, asset_cache):
+    """
+    One navigation to Kong Manager per worker before the first test, the browser, its connections and the asset
+    cache start cold and would otherwise be charged to the first test
+    """
+    context = browser_pool.new_context(env_config.browser, env_config.headless)
+    if asset_cache:
+        asset_cache.install(context)
+    try:
+        start = time.perf_counter()
+        context.new_page().goto(env_config.url, wait_until="load")
+        logger.info(f"Kong Manager warmed up in {(time.perf_counter() - start) * 1000:.0f} ms")
+    finally:
+        context.close()
+
+
+@pytest.fixture(scope='function')
+def context(request, env_config, browser_pool, trace_recorder, asset_cache, auth_state, validated_locators,
+            manager_warmup):
+    permissions = ["clipboard-read", "clipboard-write"]
+    storage_state = auth_state.path if auth_state else None
+    # a new context per test keeps cookies and storage isolated
+    context = browser_pool.new_context(env_config.browser, env_config.headless,
+                                       permissions=permissions, storage_state=storage_state)
+    if asset_cache:
+        asset_cache.install(context)
+    # 录制日志
+    trace_recorder.start(context)
+    trace_recorder.start_chunk(context, request.node.nodeid)
+    context.set_default_timeout(10 * 1000)
+    yield context
+    # 保存日志
+    trace_recorder.stop_chunk(context, request.node.nodeid, _failed(request.node))
+    trace_recorder.stop(context)
+    context.close()
+
+
+@pytest.fixture(scope='function')
+def page(env_config, context, auth_state, workspace_name):
+    page = context.new_page()
+    if not auth_state:
         page.goto(env_config.url)
         yield page
-        # 保存日志
-        context.tracing.stop(
-            path=os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "trace.zip"))
-        context.close()
-        browser.close()
+        return
+    # the context is already logged in, land on the workspace under test directly
+    Workspace(page).goto_workspace(env_config.url, workspace_name)
+    if Login(page).is_login_page():
+        # the saved session expired, log in again and refresh the storage state for the following contexts
+        auth_state.login(page, env_config.url, workspace_name)
+    yield page
@@ -3,7 +3,7 @@ import os.path
 from pages.page_workspaces import Workspaces
 from pages.page_workspace import Workspace
 from pages.page_route import Route
-from pages.page_gateway_service import GatewayService
+from pages.page_gateway_service import GatewayService, ModelAddGatewayService
 from utils.random_util import RandomUtil
 import pytest
 from ui_tests.base_test.ui_base_test import UIBaseTest
@@ -18,41 +18,41 @@ class TestGatewayService(UIBaseTest):
     def setup_teardown_method(self, init_url_page):
         self.workspaces = Workspaces(self.page)
         self.workspace = Workspace(self.page)
-        self.gateway_service = GatewayService(self.page)
-        self.route = Route(self.page)
-        self.route.delete_all_routes(self.base_url)
-        self.gateway_service.delete_all_gateway_services(self.base_url)
-        self.verifier.verify_equals(GatewayService(self.page).count_gateway_services(self.base_url), 0)
+        self.gateway_service = GatewayService(self.page, ledger=self.ledger)
+        self.route = Route(self.page, ledger=self.ledger)
+        self.purge_gateway_entities()
+        self.verifier.verify_equals(self.count_gateway_services(), 0)
         yield
 
     @pytest.mark.smoke
     @pytest.mark.golden
     def test_new_gateway_service(self):
-        self.gateway_service.goto_gateway_service(self.base_url)
+        self.gateway_service.goto_gateway_service(self.base_url, self.workspace_name)
         paras = {
-            "name": f"kim{RandomUtil.timestamp()}",
+            "name": RandomUtil.unique_name("kim"),
             "url": f"http://kim.org"
         }
         self.gateway_service.new_gateway_service(paras)
         # TODO simply verify the entity count for now, could validate the entity's attributes with the input in the future
-        self.verifier.verify_equals(GatewayService(self.page).count_gateway_services(self.base_url), 1)
+        self.verifier.verify_equals(self.gateway_service.count_gateway_services(self.base_url, self.workspace_name), 1)
 
     @pytest.mark.smoke
     @pytest.mark.golden
-    @pytest.mark.parametrize("paras", YamlUtil.read_yaml(os.path.join(test_data_dir, "new_gateway_service.yaml")))
+    @pytest.mark.parametrize("paras", YamlUtil.read_records(
+        os.path.join(test_data_dir, "new_gateway_service.yaml"), ModelAddGatewayService))
     def test_new_gateway_service_parameterized(self, paras):
-        self.gateway_service.goto_gateway_service(self.base_url)
+        self.gateway_service.goto_gateway_service(self.base_url, self.workspace_name)
         self.gateway_service.new_gateway_service(paras)
         # TODO simply verify the entity count for now, could validate the entity's attributes with the input in the future
-        self.verifier.verify_equals(GatewayService(self.page).count_gateway_services(self.base_url), 1)
+        self.verifier.verify_equals(self.gateway_service.count_gateway_services(self.base_url, self.workspace_name), 1)
 
     def test_add_gateway_service_duplicate(self):
-        self.gateway_service.goto_gateway_service(self.base_url)
+        self.gateway_service.goto_gateway_service(self.base_url, self.workspace_name)
         paras = {
-            "name": f"kim{RandomUtil.timestamp()}",
+            "name": RandomUtil.unique_name("kim"),
             "url": f"http://kim.org"
         }
         self.gateway_service.new_gateway_service(paras)
         self.gateway_service.new_gateway_service(paras)
-        message = self.page.locator(self.gateway_service.alert_message).text_content()
+        message = self.gateway_service.alert_message.text_content()
         self.verifier.verify_in("UNIQUE violation detected", message)
@@ -0,0 +1,79 @@
+import asyncio
+import os
+import pytest
+from pages.aio.page_gateway_service import GatewayService
+from pages.page_gateway_service import ModelAddGatewayService
+from ui_tests.base_test.base_verifier import BaseVerifier
+from utils.page_fan_out import PageFanOut
+from utils.yaml_util import YamlUtil
+from utils.log_util import logger
+
+
+class TestGatewayServiceAio:
+    test_data_dir = os.path.join(os.path.dirname(__file__), "data")
+    pages = 4
+
+    @pytest.fixture(autouse=True, scope='function')
+    def setup_teardown_method(self, env_config, async_browser_pool, admin_api, workspace_name, auth_state,
+                              entity_ledger):
+        if not admin_api:
+            pytest.skip(f"env {env_config.env_name} has no admin_url to seed gateway services")
+        self.env_config = env_config
+        self.async_browser_pool = async_browser_pool
+        self.admin_api = admin_api
+        self.workspace_name = workspace_name
+        self.ledger = entity_ledger
+        self.storage_state = auth_state.path if auth_state else None
+        self.verifier = BaseVerifier()
+        yield
+
+    async def _new_context(self):
+        context = await self.async_browser_pool.new_context(
+            self.env_config.browser, self.env_config.headless, storage_state=self.storage_state)
+        context.set_default_timeout(10 * 1000)
+        return context
+
+    async def _count_on_pages(self):
+        context = await self._new_context()
+        try:
+            pages = [await context.new_page() for _ in range(self.pages)]
+            gateway_services = [GatewayService(page) for page in pages]
+            return await asyncio.gather(*(
+                gateway_service.count_gateway_services(self.env_config.url, self.workspace_name)
+                for gateway_service in gateway_services))
+        finally:
+            await context.close()
+
+    @pytest.mark.p2
+    def test_count_gateway_services_on_concurrent_pages(self):
+        gateway_services = self.admin_api.gateway_services.create_many(
+            [{"name": f"aio{i}", "url": "http://kim.org"} for i in range(3)])
+        for gateway_service in gateway_services:
+            self.ledger.record("services", gateway_service)
+        counts = self.async_browser_pool.run(self._count_on_pages)
+        self.verifier.verify_equals(counts, [3] * self.pages)
+
+    async def _fan_out_new_gateway_services(self, items):
+        context = await self._new_context()
+        try:
+            return await PageFanOut(context, tabs=self.pages).new_gateway_services(
+                items, self.env_config.url, self.workspace_name, self.ledger)
+        finally:
+            await context.close()
+
+    @pytest.mark.p2
+    def test_fan_out_new_gateway_services_from_yaml(self):
+        items = YamlUtil.read_records(os.path.join(self.test_data_dir, "new_gateway_service.yaml"), ModelAddGatewayService)
+        results = self.async_browser_pool.run(self._fan_out_new_gateway_services, items)
+        logger.info(f"fan-out summary: {PageFanOut.summary(results)}")
+        self.verifier.verify_equals([result.error for result in results if not result.ok], [])
+        self.verifier.verify_equals(self.admin_api.gateway_services.count(), len(items))
+
+    @pytest.mark.p2
+    def test_fan_out_new_gateway_services_from_generator(self):
+        total = 12
+        items = ({"name": f"fanout{i}", "url": "http://kim.org"} for i in range(total))
+        results = self.async_browser_pool.run(self._fan_out_new_gateway_services, items)
+        logger.info(f"fan-out summary: {PageFanOut.summary(results)}")
+        self.verifier.verify_equals(PageFanOut.summary(results)["succeeded"], total)
+        self.verifier.verify_equals(self.admin_api.gateway_services.count(), total)
@@ -0,0 +1,36 @@
+import os
+import pytest
+from ui_tests.base_test.base_verifier import BaseVerifier
+
+
+@pytest.fixture(autouse=True, scope='function')
+def init_admin_api(request, admin_api, db_snapshots, entity_ledger):
+    if db_snapshots is None:
+        pytest.skip("the env has no Kong database to snapshot")
+    request.instance.admin_api = admin_api
+    request.instance.ledger = entity_ledger
+    request.instance.verifier = BaseVerifier()
+
+
+class TestCleanKongState:
+
+    def test_starts_clean(self):
+        self.verifier.verify_true(self.admin_api.gateway_services.is_empty())
+        self.ledger.record("services", self.admin_api.gateway_services.new_gateway_service(
+            "kim", url="http://kim.org"))
+
+
+@pytest.mark.kong_state("preseeded")
+class TestPreseededKongState:
+
+    def test_starts_preseeded(self):
+        count = int(os.getenv("KONG_STATE_SEED_COUNT", "100"))
+        self.verifier.verify_equals(self.admin_api.gateway_services.count(), count)
+        self.verifier.verify_equals(self.admin_api.routes.count(), count)
+
+
+class TestCleanAfterPreseeded:
+
+    def test_preseeded_entities_are_restored_away(self):
+        self.verifier.verify_true(self.admin_api.gateway_services.is_empty())
+        self.verifier.verify_true(self.admin_api.routes.is_empty())
@@ -11,24 +11,23 @@ class TestRoute(UIBaseTest):
 
     @pytest.fixture(autouse=True, scope='function')
     def setup_teardown_method(self, init_url_page):
-        self.route = Route(self.page)
+        self.route = Route(self.page, ledger=self.ledger)
         self.workspace = Workspace(self.page)
-        self.gateway_service = GatewayService(self.page)
-        self.route.delete_all_routes(self.base_url)
-        self.gateway_service.delete_all_gateway_services(self.base_url)
+        self.gateway_service = GatewayService(self.page, ledger=self.ledger)
+        self.purge_gateway_entities()
         yield
 
     @pytest.mark.golden
     def test_new_route(self):
-        self.gateway_service.goto_gateway_service(self.base_url)
-        name = f"{RandomUtil.timestamp()}"
+        self.gateway_service.goto_gateway_service(self.base_url, self.workspace_name)
+        name = RandomUtil.unique_name("kim")
         paras = {
             "name": name,
             "url": f"http://kim.org"
         }
         self.gateway_service.new_gateway_service(paras)
-        existing = self.route.count_route(self.base_url)
-        self.route.goto_routes(self.base_url)
+        existing = self.route.count_route(self.base_url, self.workspace_name)
+        self.route.goto_routes(self.base_url, self.workspace_name)
         self.route.new_route(name)
-        new = self.route.count_route(self.base_url)
+        new = self.route.count_route(self.base_url, self.workspace_name)
         self.verifier.verify_equals(new, existing + 1)
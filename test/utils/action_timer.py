@@ -0,0 +1,138 @@
+import functools
+import inspect
+import json
+import math
+import os
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+try:
+    import allure
+except ImportError:
+    allure = None
+
+
+def percentile(samples, pct):
+    """
+    Nearest-rank percentile of samples
+    """
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(samples):
+    return {
+        "count": len(samples),
+        "p50": round(percentile(samples, 50), 3),
+        "p95": round(percentile(samples, 95), 3),
+        "p99": round(percentile(samples, 99), 3),
+        "max": round(max(samples), 3),
+        "total": round(sum(samples), 3)
+    }
+
+
+class ActionTimer:
+    """
+    Wall time in ms of page-object actions and of the Playwright calls below them, aggregated per test into
+    p50/p95/max, and dumped as a json report at the end of the session
+    """
+    # Playwright calls that are timed once instrument_playwright() is called
+    page_calls = ("goto", "reload", "go_back", "go_forward", "wait_for_load_state", "wait_for_url")
+    locator_calls = ("click", "fill", "check", "count", "wait_for", "get_attribute", "text_content")
+
+    def __init__(self):
+        self._test = None
+        self._samples = defaultdict(list)
+        self._tests = {}
+        self._instrumented = False
+
+    def record(self, action, elapsed_ms):
+        self._samples[action].append(elapsed_ms)
+
+    @contextmanager
+    def measure(self, action):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(action, (time.perf_counter() - start) * 1000)
+
+    def timed(self, action):
+        """
+        Decorator to time a function or a coroutine function as action
+        """
+        def decorator(func):
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.measure(action):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.measure(action):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def samples(self, action):
+        """
+        :return: samples of the action recorded in the current test
+        """
+        return list(self._samples.get(action, []))
+
+    def start_test(self, nodeid):
+        self._test = nodeid
+        self._samples = defaultdict(list)
+
+    def stop_test(self):
+        """
+        :return: summary of the actions of the current test
+        """
+        summary = {action: summarize(samples) for action, samples in self._samples.items()}
+        self._tests[self._test] = {"samples": dict(self._samples), "summary": summary}
+        self._test = None
+        self._samples = defaultdict(list)
+        return summary
+
+    def attach(self, summary, name="action timings"):
+        if allure is not None and summary:
+            allure.attach(json.dumps(summary, indent=2), name=name, attachment_type=allure.attachment_type.JSON)
+
+    def report(self):
+        merged = defaultdict(list)
+        for test in self._tests.values():
+            for action, samples in test["samples"].items():
+                merged[action].extend(samples)
+        return {
+            "actions": {action: summarize(samples) for action, samples in sorted(merged.items())},
+            "tests": {nodeid: test["summary"] for nodeid, test in self._tests.items()}
+        }
+
+    def dump(self, path):
+        if not self._tests:
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.report(), file, indent=2)
+
+    def instrument_playwright(self):
+        """
+        Time the Playwright calls used by page objects, the sync api classes are patched in place so that
+        page objects keep getting real Page and Locator objects
+        """
+        if self._instrumented:
+            return
+        from playwright.sync_api import Page, Locator
+        for cls, calls in ((Page, self.page_calls), (Locator, self.locator_calls)):
+            for name in calls:
+                setattr(cls, name, self.timed(f"{cls.__name__.lower()}.{name}")(getattr(cls, name)))
+        self._instrumented = True
+
+
+action_timer = ActionTimer()
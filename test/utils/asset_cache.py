@@ -0,0 +1,90 @@
+import re
+import threading
+from collections import OrderedDict
+from playwright.sync_api import BrowserContext, Route
+from utils.log_util import logger
+
+
+class AssetCache:
+    """
+    Size bounded LRU cache of the hashed JS/CSS/font assets of Kong Manager, shared by all contexts of a session,
+    so that a fresh context doesn't download the SPA bundle again on every page.goto
+
+    Only hashed file names are cached (e.g. index-3f2a9c1b.js), their content never changes for a given name.
+    Analytics/telemetry requests can also be aborted.
+    """
+    asset_url = re.compile(r"^[^?#]*[.-][0-9A-Za-z_]{8,}\.(?:js|mjs|css|woff2?|ttf|otf)(?:[?#].*)?$")
+    telemetry_url = re.compile(
+        r"google-analytics\.com|googletagmanager\.com|segment\.(?:io|com)|sentry\.io|datadoghq|/analytics|/telemetry",
+        re.IGNORECASE)
+    # headers that describe the original transfer and must not be replayed with a decoded body
+    skipped_headers = ("content-encoding", "content-length", "transfer-encoding")
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, cache_assets=True, block_telemetry=False):
+        self.max_bytes = max_bytes
+        self.cache_assets = cache_assets
+        self.block_telemetry = block_telemetry
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        return self._size
+
+    def get(self, url):
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(url)
+            self.hits += 1
+            return entry
+
+    def put(self, url, status, headers, body):
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if url in self._entries:
+                self._size -= len(self._entries.pop(url)[2])
+            self._entries[url] = (status, headers, body)
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def install(self, context: BrowserContext):
+        if self.cache_assets:
+            context.route(self.asset_url, self._handle_asset)
+        if self.block_telemetry:
+            context.route(self.telemetry_url, self._handle_telemetry)
+
+    def _handle_asset(self, route: Route):
+        request = route.request
+        if request.method != "GET":
+            route.fallback()
+            return
+        entry = self.get(request.url)
+        if entry is not None:
+            status, headers, body = entry
+            route.fulfill(status=status, headers=headers, body=body)
+            return
+        response = route.fetch()
+        body = response.body()
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in self.skipped_headers}
+        if response.ok:
+            self.put(request.url, response.status, headers, body)
+        route.fulfill(status=response.status, headers=headers, body=body)
+
+    @staticmethod
+    def _handle_telemetry(route: Route):
+        route.abort()
+
+    def log_stats(self):
+        logger.info(f"asset cache: {len(self)} entries, {self._size} bytes, {self.hits} hits, {self.misses} misses")
@@ -0,0 +1,50 @@
+from anyio.from_thread import BlockingPortal
+from playwright.async_api import async_playwright, Browser, BrowserContext
+from utils.browser_pool import BrowserPool
+from utils.log_util import logger
+
+
+class AsyncBrowserPool:
+    """
+    Async mirror of BrowserPool for the page objects in /test/pages/aio.
+
+    The sync Playwright API keeps its own event loop marked as running in the main thread, so the async API runs
+    on the event loop of an anyio blocking portal, i.e. a background thread of the same worker. One loop drives
+    many pages concurrently, sync tests hand coroutines over to it with run().
+    """
+
+    def __init__(self, portal: BlockingPortal):
+        self._portal = portal
+        self._playwright = None
+        self._browsers = {}
+
+    def run(self, async_fn, *args):
+        """
+        Run async_fn(*args) on the event loop of the pool and wait for its result
+        """
+        return self._portal.call(async_fn, *args)
+
+    async def get(self, browser_name, headless) -> Browser:
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        key = (browser_name, headless)
+        browser = self._browsers.get(key)
+        if browser is None or not browser.is_connected():
+            browser_type = getattr(self._playwright, browser_name, self._playwright.webkit)
+            logger.debug(f"launch async browser {browser_type.name}, headless={headless}")
+            browser = await browser_type.launch(headless=headless, args=BrowserPool.launch_args.get(browser_type.name))
+            self._browsers[key] = browser
+        return browser
+
+    async def new_context(self, browser_name, headless, **kwargs) -> BrowserContext:
+        browser = await self.get(browser_name, headless)
+        return await browser.new_context(**kwargs)
+
+    async def close(self):
+        for browser in self._browsers.values():
+            if browser.is_connected():
+                await browser.close()
+        self._browsers.clear()
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
@@ -0,0 +1,47 @@
+import hashlib
+import os
+import time
+from playwright.sync_api import Page
+from pages.page_login import Login
+from pages.page_workspaces import Workspaces
+from utils.log_util import logger
+
+
+class AuthState:
+    """
+    Playwright storage_state of a logged-in Kong Manager session, saved to disk once and passed to every new context,
+    so that contexts start authenticated without logging in again
+
+    The file is keyed by env name and credentials, it is refreshed when it is older than ttl seconds, or when a page
+    gets redirected to the login page because the session expired
+    """
+
+    def __init__(self, state_dir, env_name, username, password, ttl=30 * 60):
+        self.username = username
+        self._password = password
+        self.ttl = ttl
+        key = hashlib.sha1(f"{env_name}:{username}:{password}".encode("utf-8")).hexdigest()[:12]
+        self.path = os.path.join(state_dir, f"{env_name}-{key}.json")
+
+    def is_fresh(self):
+        return os.path.exists(self.path) and time.time() - os.path.getmtime(self.path) < self.ttl
+
+    def invalidate(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def login(self, page: Page, base_url, workspace_name="default"):
+        """
+        Log in on the page, select the workspace and save the storage_state of its context
+        """
+        Login(page).login(base_url, self.username, self._password)
+        Workspaces(page).go_to_workspace(base_url, workspace_name)
+        self.save(page)
+
+    def save(self, page: Page):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # parallel workers may save the same file, replace it atomically
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        page.context.storage_state(path=tmp_path)
+        os.replace(tmp_path, self.path)
+        logger.debug(f"storage state of {self.username} saved to {self.path}")
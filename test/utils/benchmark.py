@@ -0,0 +1,73 @@
+import json
+import os
+import time
+from utils.action_timer import summarize
+from utils.log_util import logger
+
+
+class Benchmark:
+    """
+    Latency samples of benchmark metrics, saved as json
+
+    Modes:
+        record: the results are saved as the baseline
+        compare: the results are compared with the baseline, a metric regresses when its p95 is more than
+            threshold (a ratio, 0.2 means 20%) slower than the baseline p95
+    """
+    modes = ("record", "compare")
+
+    def __init__(self, baseline_path, mode, threshold=0.2):
+        if mode not in self.modes:
+            raise ValueError(f"unknown benchmark mode {mode}, expected one of {self.modes}")
+        self.baseline_path = baseline_path
+        self.mode = mode
+        self.threshold = threshold
+        self.results = {}
+        self.baseline = {}
+        if os.path.exists(baseline_path):
+            with open(baseline_path, encoding="utf-8") as file:
+                self.baseline = json.load(file)
+
+    @staticmethod
+    def time(func, repeat):
+        """
+        :return: wall time in ms of each of the repeat calls of func
+        """
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - start) * 1000)
+        return samples
+
+    def add(self, metric, samples):
+        self.results[metric] = summarize(samples)
+        logger.info(f"benchmark {metric}: {self.results[metric]}")
+
+    def check(self, metric):
+        """
+        :return: whether the metric is within the threshold of the baseline, and a message describing the check
+        """
+        result = self.results[metric]
+        base = self.baseline.get(metric)
+        if self.mode != "compare" or not base:
+            return True, f"{metric} p95={result['p95']}ms, no baseline to compare"
+        limit = base["p95"] * (1 + self.threshold)
+        return result["p95"] <= limit, \
+            f"{metric} p95={result['p95']}ms, baseline p95={base['p95']}ms, limit={round(limit, 3)}ms"
+
+    def save(self, results_path):
+        """
+        Write the results of this run, in record mode they are also merged into the baseline
+        """
+        if not self.results:
+            return
+        os.makedirs(os.path.dirname(results_path), exist_ok=True)
+        with open(results_path, "w", encoding="utf-8") as file:
+            json.dump(self.results, file, indent=2, sort_keys=True)
+        if self.mode == "record":
+            baseline = dict(self.baseline)
+            baseline.update(self.results)
+            os.makedirs(os.path.dirname(self.baseline_path), exist_ok=True)
+            with open(self.baseline_path, "w", encoding="utf-8") as file:
+                json.dump(baseline, file, indent=2, sort_keys=True)
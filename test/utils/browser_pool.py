@@ -0,0 +1,40 @@
+from playwright.sync_api import Playwright, Browser, BrowserContext
+from utils.log_util import logger
+
+
+class BrowserPool:
+    """
+    Browsers launched once per session (per worker when running in parallel), keyed by (browser, headless),
+    tests only pay for a new BrowserContext which gives them fresh cookies and storage
+    """
+    launch_args = {
+        "chromium": ["--no-sandbox", "--no-zygote"]
+    }
+
+    def __init__(self, playwright: Playwright):
+        self._playwright = playwright
+        self._browsers = {}
+
+    def get(self, browser_name, headless) -> Browser:
+        key = (browser_name, headless)
+        browser = self._browsers.get(key)
+        if browser is None or not browser.is_connected():
+            if browser_name == "chromium":
+                browser_type = self._playwright.chromium
+            elif browser_name == "firefox":
+                browser_type = self._playwright.firefox
+            else:
+                browser_type = self._playwright.webkit
+            logger.debug(f"launch browser {browser_type.name}, headless={headless}")
+            browser = browser_type.launch(headless=headless, args=self.launch_args.get(browser_type.name))
+            self._browsers[key] = browser
+        return browser
+
+    def new_context(self, browser_name, headless, **kwargs) -> BrowserContext:
+        return self.get(browser_name, headless).new_context(**kwargs)
+
+    def close(self):
+        for browser in self._browsers.values():
+            if browser.is_connected():
+                browser.close()
+        self._browsers.clear()
@@ -0,0 +1,90 @@
+import random
+from itertools import count as counter, islice
+from pages.locators import GatewayServiceLocators
+from pages.page_gateway_service import ModelAddGatewayService
+from utils.random_util import RandomUtil
+
+
+class DataGenerator:
+    """
+    Lazy generator of gateway services and routes, items are produced one at a time so that 100k entities are never
+    materialized in full, e.g. admin_api.gateway_services.create_many(s.to_admin_payload() for s in gen.gateway_services(n))
+
+    Services cover the protocol branches of the gateway service form: a url, or protocol, host and port with a path
+    for http and websocket protocols only. Routes match the protocol of their service. Values are drawn from RandomUtil,
+    which is seeded per test, or from a generator of their own when a seed is given, names are unique across workers
+    """
+    # protocols listening on 443 by default
+    tls_protocols = ("https", "grpcs", "wss", "tls", "tls_passthrough")
+    # route protocols by service protocol, a route of a http service also serves https
+    route_protocols = {
+        "http": ["http", "https"], "https": ["http", "https"],
+        "grpc": ["grpc", "grpcs"], "grpcs": ["grpc", "grpcs"],
+        "ws": ["ws", "wss"], "wss": ["ws", "wss"],
+    }
+
+    def __init__(self, seed=None, prefix="gen", hosts=("kim.org",)):
+        self._random = random.Random(seed) if seed is not None else RandomUtil.rng()
+        self.prefix = prefix
+        self.hosts = hosts
+
+    @staticmethod
+    def _has_path(protocol):
+        return protocol.startswith(GatewayServiceLocators.path_protocols)
+
+    def gateway_service(self, protocol=None, url_ratio=0.5):
+        """
+        :param protocol: protocol of the service, a random one if None
+        :param url_ratio: share of http/websocket services given as a url instead of separate elements
+        """
+        protocol = protocol or self._random.choice(ModelAddGatewayService.protocols)
+        name = RandomUtil.unique_name(self.prefix)
+        host = self._random.choice(self.hosts)
+        port = 443 if protocol in self.tls_protocols else 80
+        path = f"/{name}" if self._has_path(protocol) else None
+        if path and self._random.random() < url_ratio:
+            return ModelAddGatewayService(name, url=f"{protocol}://{host}:{port}{path}")
+        return ModelAddGatewayService(name, protocol=protocol, host=host, path=path, port=str(port))
+
+    def gateway_services(self, count=None, protocols=None, url_ratio=0.5):
+        """
+        :param count: number of services, endless if None
+        :param protocols: protocols drawn from, all protocols of a gateway service if None
+        :return: a generator of ModelAddGatewayService, to fill the form or to_admin_payload() for the Admin API
+        """
+        protocols = protocols or ModelAddGatewayService.protocols
+        services = (self.gateway_service(self._random.choice(protocols), url_ratio) for _ in counter())
+        return services if count is None else islice(services, count)
+
+    @staticmethod
+    def _protocol(service):
+        protocol = service.get("protocol")
+        if not protocol and service.get("url"):
+            protocol = service["url"].split("://", 1)[0]
+        return protocol
+
+    def route(self, service):
+        """
+        :param service: a gateway service created by the Admin API, or a ModelAddGatewayService
+        :return: the Admin API payload of a route of the service
+        """
+        protocol = self._protocol(service)
+        name = RandomUtil.unique_name(f"{self.prefix}-route")
+        reference = {"id": service["id"]} if service.get("id") else {"name": service["name"]}
+        route = {"name": name, "service": reference}
+        if protocol in self.route_protocols:
+            route.update(protocols=self.route_protocols[protocol], paths=[f"/{name}"])
+        elif protocol == "tls_passthrough":
+            route.update(protocols=[protocol], snis=[f"{name}.{self._random.choice(self.hosts)}"])
+        else:
+            # tcp, tls and udp routes match on the destination port
+            route.update(protocols=[protocol], destinations=[{"port": self._random.randint(1024, 65535)}])
+        return route
+
+    def routes(self, services, per_service=1):
+        """
+        :return: a generator of Admin API route payloads, per_service routes for each of services
+        """
+        for service in services:
+            for _ in range(per_service):
+                yield self.route(service)
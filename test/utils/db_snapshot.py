@@ -0,0 +1,113 @@
+import subprocess
+from utils.health_gate import HealthGate, kong_status_check
+from utils.log_util import logger
+
+
+class StandInSnapshots:
+    """
+    Named snapshots of the state of the in-process Admin API stand-in, used in hermetic mode
+    """
+
+    def __init__(self, store):
+        self._store = store
+        self._snapshots = {}
+
+    def __contains__(self, name):
+        return name in self._snapshots
+
+    def take(self, name):
+        self._snapshots[name] = self._store.snapshot()
+
+    def restore(self, name):
+        self._store.restore(self._snapshots[name])
+
+    def drop_all(self):
+        self._snapshots.clear()
+
+
+class PostgresSnapshots:
+    """
+    Named snapshots of the Kong database as template databases, created next to it in the Postgres container of
+    docker-compose (kong-ee-database, its data lives in the kong_db_data volume). Copying a database from a template
+    is a file-level copy, much faster than replaying a pg_dump, but the source can't have open connections: the
+    connections of Kong are terminated during the copy and Kong reconnects, its entity cache is purged after a restore
+
+    The whole database is restored, every workspace included, so it can't be shared by parallel workers
+    """
+    prefix = "kong_snapshot_"
+
+    def __init__(self, container, admin_api, database="kong", user="kong", docker="docker"):
+        self.container = container
+        self.admin_api = admin_api
+        self.database = database
+        self.user = user
+        self.docker = docker
+        self._snapshots = set()
+
+    def _psql(self, *statements):
+        command = [self.docker, "exec", self.container, "psql", "-U", self.user, "-d", "postgres", "-q",
+                   "-v", "ON_ERROR_STOP=1"]
+        # each -c runs in its own transaction, CREATE/DROP DATABASE can't run in a transaction block
+        for statement in statements:
+            command += ["-c", statement]
+        try:
+            subprocess.run(command, check=True, capture_output=True, text=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"psql in {self.container} failed: {e.stderr.strip()}") from None
+        except OSError as e:
+            raise RuntimeError(f"can't run {self.docker}: {e}") from None
+
+    def __contains__(self, name):
+        return name in self._snapshots
+
+    def check(self):
+        """
+        :raise RuntimeError: if psql can't be run in the container, e.g. no docker CLI or no permission to exec
+        """
+        self._psql("SELECT 1")
+
+    @staticmethod
+    def _terminate(database):
+        return f"SELECT pg_terminate_backend(pid) FROM pg_stat_activity " \
+               f"WHERE datname = '{database}' AND pid <> pg_backend_pid()"
+
+    def take(self, name):
+        snapshot = f"{self.prefix}{name}"
+        try:
+            self._psql(
+                f'ALTER DATABASE "{self.database}" ALLOW_CONNECTIONS false',
+                self._terminate(self.database),
+                f'DROP DATABASE IF EXISTS "{snapshot}"',
+                f'CREATE DATABASE "{snapshot}" TEMPLATE "{self.database}"',
+            )
+        finally:
+            self._psql(f'ALTER DATABASE "{self.database}" ALLOW_CONNECTIONS true')
+        self._snapshots.add(name)
+
+    def restore(self, name):
+        if name not in self._snapshots:
+            raise KeyError(f"no snapshot {name}, taken snapshots: {sorted(self._snapshots)}")
+        # the copy is made next to the database, which is only replaced once the copy succeeded
+        restoring = f"{self.prefix}restoring"
+        self._psql(
+            f'DROP DATABASE IF EXISTS "{restoring}"',
+            f'CREATE DATABASE "{restoring}" TEMPLATE "{self.prefix}{name}"',
+        )
+        try:
+            self._psql(
+                f'ALTER DATABASE "{self.database}" ALLOW_CONNECTIONS false',
+                self._terminate(self.database),
+                f'DROP DATABASE "{self.database}"',
+                f'ALTER DATABASE "{restoring}" RENAME TO "{self.database}"',
+            )
+        finally:
+            self._psql(f'ALTER DATABASE "{self.database}" ALLOW_CONNECTIONS true')
+        # Kong reconnects on its next query, its entity cache and router still reflect the replaced database
+        HealthGate(timeout=30, initial_delay=0.1).add("admin_api", kong_status_check(self.admin_api.admin_url)).wait()
+        self.admin_api.purge_cache()
+        logger.debug(f"restored snapshot {name} of database {self.database}")
+
+    def drop_all(self):
+        for name in sorted(self._snapshots) + ["restoring"]:
+            self._psql(f'DROP DATABASE IF EXISTS "{self.prefix}{name}"')
+        self._snapshots.clear()
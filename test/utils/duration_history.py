@@ -0,0 +1,143 @@
+import json
+import os
+import statistics
+import pytest
+from utils.log_util import logger
+
+try:
+    from xdist.scheduler import LoadScopeScheduling
+except ImportError:
+    LoadScopeScheduling = None
+
+
+class DurationHistory:
+    """
+    Durations in seconds of past runs by test nodeid, a new sample is averaged with the history (exponential moving
+    average) so that a single slow run doesn't reshuffle the schedule
+    """
+    weight = 0.5
+    # estimate of a test without history when there is no history at all
+    default_duration = 1.0
+
+    def __init__(self, path):
+        self.path = path
+        self._durations = {}
+        self._run = {}
+        if os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as file:
+                    self._durations = json.load(file)
+            except ValueError:
+                logger.warning(f"ignore corrupted duration history {path}")
+
+    def __len__(self):
+        return len(self._durations)
+
+    def get(self, nodeid):
+        return self._durations.get(nodeid)
+
+    def add(self, nodeid, seconds):
+        """
+        Add the duration of a phase (setup, call or teardown) of a test of this run
+        """
+        self._run[nodeid] = self._run.get(nodeid, 0.0) + seconds
+
+    def estimate(self, nodeids):
+        """
+        :return: estimated duration of the tests, a test without history counts as the median test
+        """
+        unknown = statistics.median(self._durations.values()) if self._durations else self.default_duration
+        return sum(self._durations.get(nodeid, unknown) for nodeid in nodeids)
+
+    def save(self):
+        if not self._run:
+            return
+        for nodeid, seconds in self._run.items():
+            previous = self._durations.get(nodeid)
+            self._durations[nodeid] = round(
+                seconds if previous is None else self.weight * seconds + (1 - self.weight) * previous, 3)
+        self._run = {}
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(self._durations, file, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+if LoadScopeScheduling is not None:
+    class DurationScheduling(LoadScopeScheduling):
+        """
+        pytest-xdist loadscope scheduling, tests of a class (or of a module for plain functions) still run together
+        on one worker, but the scopes are sent longest-processing-time first according to the duration history,
+        one at a time to the first worker that is free, so that long classes don't end up last on a single worker
+        """
+
+        def __init__(self, config, log=None, history=None):
+            super().__init__(config, log)
+            self.history = history
+
+        def schedule(self):
+            assert self.collection_is_completed
+            if self.collection is not None:
+                for node in self.nodes:
+                    self._reschedule(node)
+                return
+            if not self._check_nodes_have_same_collection():
+                self.log("**Different tests collected, aborting run**")
+                return
+            self.collection = list(next(iter(self.registered_collections.values())))
+            if not self.collection:
+                return
+            work_units = {}
+            for nodeid in self.collection:
+                work_units.setdefault(self._split_scope(nodeid), {})[nodeid] = False
+            for scope, work_unit in sorted(work_units.items(), key=lambda unit: -self.history.estimate(unit[1])):
+                self.workqueue[scope] = work_unit
+            # avoid having more workers than work
+            for _ in range(len(self.nodes) - len(self.workqueue)):
+                unused_node, _ = self.assigned_work.popitem()
+                unused_node.shutdown()
+            for node in self.nodes:
+                self._assign_work_unit(node)
+            if not self.workqueue:
+                for node in self.nodes:
+                    node.shutdown()
+
+        def _reschedule(self, node):
+            if node.shutting_down:
+                return
+            if not self.workqueue:
+                node.shutdown()
+                return
+            # a worker holds back its last test until it gets more work, as it needs the next test for teardown
+            if self._pending_of(self.assigned_work[node]) > 1:
+                return
+            self._assign_work_unit(node)
+else:
+    DurationScheduling = None
+
+
+class DurationPlugin:
+    """
+    pytest plugin recording the duration of every test to the history after each run, and scheduling
+    "pytest -n <workers> --dist loadscope" runs with DurationScheduling
+    """
+
+    def __init__(self, history: DurationHistory):
+        self.history = history
+
+    def pytest_runtest_logreport(self, report):
+        # with pytest-xdist the reports of the workers are also replayed in the controller, which saves the history
+        if not os.getenv("PYTEST_XDIST_WORKER"):
+            self.history.add(report.nodeid, report.duration)
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        if not os.getenv("PYTEST_XDIST_WORKER"):
+            self.history.save()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        if DurationScheduling is None or config.getoption("dist") != "loadscope":
+            return None
+        logger.info(f"schedule test scopes longest first from {len(self.history)} recorded durations")
+        return DurationScheduling(config, log, self.history)
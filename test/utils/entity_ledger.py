@@ -0,0 +1,75 @@
+import threading
+from utils.log_util import logger
+
+
+class EntityLedger:
+    """
+    Gateway entities created by a test, page objects record them from the Admin API responses of their forms,
+    so that teardown deletes exactly what the test created instead of scanning and purging the whole workspace
+    """
+    # Admin API entities in deletion order, routes reference services so they go first
+    deletion_order = ("routes", "services")
+
+    def __init__(self):
+        self._entries = {entity: [] for entity in self.deletion_order}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._entries.values())
+
+    def record(self, entity, body):
+        """
+        :param entity: Admin API entity, e.g. services
+        :param body: the entity returned by the Admin API on creation
+        """
+        with self._lock:
+            self._entries[entity].append((body["id"], body.get("name")))
+
+    def entries(self, entity):
+        """
+        :return: (id, name) of the recorded entities, in creation order
+        """
+        return list(self._entries[entity])
+
+    @staticmethod
+    def _endpoint(admin_api, entity):
+        return admin_api.routes if entity == "routes" else admin_api.gateway_services
+
+    def purge(self, admin_api):
+        """
+        Delete the recorded entities, newest first, entities already deleted by the test are skipped
+        :return: number of recorded entities
+        """
+        deleted = 0
+        for entity in self.deletion_order:
+            with self._lock:
+                entries = self._entries[entity]
+                self._entries[entity] = []
+            self._endpoint(admin_api, entity).delete_many(
+                [entity_id for entity_id, _ in reversed(entries)], missing_ok=True)
+            deleted += len(entries)
+        return deleted
+
+    @staticmethod
+    def snapshot(admin_api):
+        """
+        :return: ids of the existing entities by entity
+        """
+        return {entity: set(EntityLedger._endpoint(admin_api, entity).ids()) for entity in EntityLedger.deletion_order}
+
+    @staticmethod
+    def purge_leaks(admin_api, baseline):
+        """
+        Fallback for entities created outside the ledger, e.g. by a test that failed before the response of its form
+        arrived, every entity missing from the baseline snapshot is deleted
+        :return: number of leaked entities
+        """
+        leaked = 0
+        for entity in EntityLedger.deletion_order:
+            endpoint = EntityLedger._endpoint(admin_api, entity)
+            ids = [entity_id for entity_id in endpoint.ids() if entity_id not in baseline[entity]]
+            if ids:
+                logger.warning(f"{len(ids)} {entity} leaked in workspace {admin_api.workspace_name}, deleting them")
+                endpoint.delete_many(ids, missing_ok=True)
+            leaked += len(ids)
+        return leaked
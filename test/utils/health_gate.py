@@ -0,0 +1,137 @@
+import re
+import socket
+import struct
+import time
+from urllib.parse import urljoin, urlparse
+from requests import Session
+from utils.log_util import logger
+
+
+class HealthGateError(Exception):
+    """
+    Raised when a dependency of the tests is still unhealthy at the deadline, the message lists the last outcome
+    of every check
+    """
+
+
+class HealthGate:
+    """
+    Wait for the services the tests depend on before the first test: each check is polled with exponential backoff
+    until it passes or the deadline expires, so that a session against a Kong that never came up fails in one
+    message instead of timing out test after test
+
+    A check is a function returning a short description of the healthy service, or raising with the reason it is not
+    """
+
+    def __init__(self, timeout=120.0, initial_delay=0.25, max_delay=5.0):
+        self.timeout = timeout
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self._checks = {}
+
+    def add(self, name, check):
+        self._checks[name] = check
+        return self
+
+    def wait(self):
+        """
+        :return: the description of each service by check name
+        :raise HealthGateError: if a check still fails at the deadline
+        """
+        start = time.perf_counter()
+        pending = dict(self._checks)
+        outcomes = {}
+        attempts = dict.fromkeys(pending, 0)
+        delay = self.initial_delay
+        while True:
+            for name, check in list(pending.items()):
+                attempts[name] += 1
+                try:
+                    outcomes[name] = check()
+                    del pending[name]
+                    logger.info(f"health gate: {name} is up after {time.perf_counter() - start:.1f}s, "
+                                f"{outcomes[name]}")
+                except Exception as e:
+                    outcomes[name] = f"{type(e).__name__}: {e}"
+            elapsed = time.perf_counter() - start
+            if not pending:
+                return outcomes
+            if elapsed + delay > self.timeout:
+                diagnostics = "\n".join(
+                    f"  {name}: {'up' if name not in pending else 'DOWN'} after {attempts[name]} attempts, "
+                    f"{outcomes[name]}" for name in self._checks)
+                raise HealthGateError(f"services still down after {elapsed:.1f}s:\n{diagnostics}")
+            time.sleep(delay)
+            delay = min(delay * 2, self.max_delay)
+
+
+def http_check(url, session: Session = None, ok=lambda response: response.ok, timeout=5.0):
+    """
+    :param ok: whether the response is healthy
+    """
+    session = session or Session()
+
+    def check():
+        response = session.get(url, timeout=timeout)
+        if not ok(response):
+            raise AssertionError(f"GET {url} => {response.status_code} {response.text[:200]}")
+        return f"GET {url} => {response.status_code}"
+
+    return check
+
+
+def kong_status_check(admin_url, session: Session = None, timeout=5.0):
+    """
+    Kong Admin API /status, it also tells whether Kong reaches its database
+    """
+    session = session or Session()
+    url = f"{admin_url.rstrip('/')}/status"
+
+    def check():
+        response = session.get(url, timeout=timeout)
+        response.raise_for_status()
+        database = response.json().get("database", {})
+        if database and not database.get("reachable"):
+            raise AssertionError(f"Kong is up but can't reach its database: {response.text[:200]}")
+        return f"GET {url} => {response.status_code}, database reachable"
+
+    return check
+
+
+def postgres_check(address, timeout=5.0):
+    """
+    Postgres accepts connections, checked by its answer to an SSLRequest so that no driver or credentials are needed
+    :param address: host:port
+    """
+    host, _, port = address.rpartition(":")
+
+    def check():
+        with socket.create_connection((host, int(port)), timeout=timeout) as connection:
+            # SSLRequest: length 8 and the code 80877103, the server answers S or N
+            connection.sendall(struct.pack("!ii", 8, 80877103))
+            answer = connection.recv(1)
+        if answer not in (b"S", b"N"):
+            raise AssertionError(f"unexpected answer {answer!r} from {address}")
+        return f"postgres at {address} accepts connections"
+
+    return check
+
+
+def manager_check(url, session: Session = None, timeout=10.0):
+    """
+    Kong Manager serves its index, the JS and CSS bundles it references are fetched too, so that the first
+    navigation of a test doesn't pay for their cold start
+    """
+    session = session or Session()
+
+    def check():
+        response = session.get(url, timeout=timeout)
+        response.raise_for_status()
+        assets = re.findall(r"""<(?:script|link)[^>]+(?:src|href)=["']([^"']+\.(?:js|css))["']""", response.text)
+        for asset in assets:
+            asset_url = urljoin(response.url, asset)
+            if urlparse(asset_url).netloc == urlparse(response.url).netloc:
+                session.get(asset_url, timeout=timeout).raise_for_status()
+        return f"GET {url} => {response.status_code}, {len(assets)} bundles warmed up"
+
+    return check
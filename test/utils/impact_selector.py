@@ -0,0 +1,275 @@
+import ast
+import json
+import os
+import re
+import subprocess
+import pytest
+from utils.log_util import logger
+from utils.yaml_util import YamlUtil
+
+try:
+    import coverage
+except ImportError:
+    coverage = None
+
+
+def _git(root, *args):
+    return subprocess.run(["git", *args], cwd=root, capture_output=True, text=True, check=True).stdout
+
+
+def function_ranges(source):
+    """
+    :return: (first line, last line, qualified name) of every function and method of a python source
+    """
+    ranges = []
+
+    def visit(node, prefix):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                name = f"{prefix}{child.name}"
+                if not isinstance(child, ast.ClassDef):
+                    first = min([child.lineno] + [decorator.lineno for decorator in child.decorator_list])
+                    ranges.append((first, child.end_lineno, name))
+                visit(child, f"{name}.")
+
+    visit(ast.parse(source), "")
+    return ranges
+
+
+def function_at(ranges, lineno):
+    """
+    :return: qualified name of the innermost function containing lineno, None at module or class level
+    """
+    enclosing = [(first, name) for first, last, name in ranges if first <= lineno <= last]
+    return max(enclosing)[1] if enclosing else None
+
+
+class ImpactSelector:
+    """
+    pytest plugin selecting the tests impacted by the changes since a baseline run
+
+    Modes, set by the environment variable TEST_IMPACT:
+        record: coverage records which modules and methods of page objects, API clients and utils each test
+            executes, and YamlUtil which data files it reads (at collection time for the tests of the module),
+            the index is saved with the commit of the run
+        select: only the tests impacted by the changes since the commit of the index are run, i.e. tests that
+            executed a changed method (or any code of a file changed at module level) or read a changed data file,
+            tests of a changed test module, tests under a changed conftest.py and tests next to a changed data
+            directory. New tests are always run, and everything runs when the index is missing or the changes can't
+            be mapped, e.g. a python module of /test outside the measured packages or a file of /test no test read
+    """
+    modes = ("record", "select")
+    # packages of /test whose code is mapped to the tests executing it
+    measured = ("pages", "apis", "utils", "mock_server", "env_config", "api_tests/base_test", "ui_tests/base_test")
+    # changes that impact every test
+    full_run_files = ("pytest.ini", "requirements.txt", "docker-compose.yml", "test/env_config/default_env.ini")
+
+    def __init__(self, mode, index_path, test_root):
+        if mode not in self.modes:
+            raise ValueError(f"unknown test impact mode {mode}, expected one of {self.modes}")
+        self.mode = mode
+        self.index_path = index_path
+        self.test_root = test_root
+        self.repo_root = _git(test_root, "rev-parse", "--show-toplevel").strip()
+        self._coverage = None
+        self._summary = None
+        # data files read by each test, and by the collection of each module
+        self._test_reads = {}
+        self._module_reads = {}
+
+    def _relpath(self, path):
+        return os.path.relpath(path, self.repo_root).replace(os.sep, "/")
+
+    def _nodeid_path(self, item):
+        return self._relpath(str(item.path))
+
+    # record
+
+    def pytest_sessionstart(self, session):
+        if self.mode != "record":
+            return
+        if coverage is None:
+            raise pytest.UsageError("TEST_IMPACT=record needs the coverage package")
+        if os.getenv("PYTEST_XDIST_WORKER"):
+            raise pytest.UsageError("TEST_IMPACT=record maps tests to code in one process, run it without -n")
+        include = [os.path.join(self.test_root, package, "*") for package in self.measured]
+        self._coverage = coverage.Coverage(data_file=None, include=include)
+        self._coverage.start()
+        YamlUtil.read_files = set()
+
+    def _take_reads(self):
+        reads = {self._relpath(path) for path in YamlUtil.read_files}
+        YamlUtil.read_files.clear()
+        return reads
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_make_collect_report(self, collector):
+        if self._coverage is None or not hasattr(collector, "path"):
+            yield
+            return
+        self._take_reads()
+        yield
+        # e.g. the records of a parametrize, read when the module is imported
+        self._module_reads.setdefault(self._relpath(str(collector.path)), set()).update(self._take_reads())
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if self._coverage is None:
+            yield
+            return
+        self._coverage.switch_context(item.nodeid)
+        self._take_reads()
+        yield
+        self._coverage.switch_context("")
+        self._test_reads[item.nodeid] = self._take_reads() | self._module_reads.get(self._nodeid_path(item), set())
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        if self._coverage is None:
+            return
+        self._coverage.stop()
+        YamlUtil.read_files = None
+        data = self._coverage.get_data()
+        tests = {nodeid: {"files": set(reads), "methods": set()} for nodeid, reads in self._test_reads.items()}
+        for file in data.measured_files():
+            path = self._relpath(file)
+            with open(file, encoding="utf-8") as source:
+                ranges = function_ranges(source.read())
+            for lineno, contexts in data.contexts_by_lineno(file).items():
+                method = function_at(ranges, lineno)
+                for nodeid in contexts:
+                    if not nodeid:
+                        continue
+                    test = tests.setdefault(nodeid, {"files": set(), "methods": set()})
+                    test["files"].add(path)
+                    if method:
+                        test["methods"].add(f"{path}::{method}")
+        index = {
+            "commit": _git(self.repo_root, "rev-parse", "HEAD").strip(),
+            "tests": {nodeid: {key: sorted(values) for key, values in test.items()}
+                      for nodeid, test in sorted(tests.items())}
+        }
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        with open(self.index_path, "w", encoding="utf-8") as file:
+            json.dump(index, file, indent=1)
+        logger.info(f"test impact index of {len(tests)} tests saved to {self.index_path}")
+
+    # select
+
+    def _changed_lines(self, commit):
+        """
+        :return: changed files since commit, working tree included, with the changed line numbers of the old and the
+            new version of a modified file, None for a file added or deleted as a whole
+        """
+        changed = {}
+        for line in _git(self.repo_root, "diff", "--name-status", "--no-renames", commit).splitlines():
+            status, path = line.split("\t", 1)
+            changed[path] = {"old": set(), "new": set()} if status == "M" else None
+        for untracked in _git(self.repo_root, "ls-files", "--others", "--exclude-standard").splitlines():
+            changed[untracked] = None
+        for path, lines in changed.items():
+            if lines is None or not path.endswith(".py"):
+                continue
+            for hunk in re.finditer(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@",
+                                    _git(self.repo_root, "diff", "--unified=0", commit, "--", path), re.MULTILINE):
+                old_start, old_count, new_start, new_count = (int(group) if group else 1 for group in hunk.groups())
+                # a count of 0 is a pure insertion or deletion after that line
+                lines["old"].update(range(old_start, old_start + max(old_count, 1)))
+                lines["new"].update(range(new_start, new_start + max(new_count, 1)))
+        return changed
+
+    def _changed_methods(self, commit, path, lines):
+        """
+        :return: qualified names of the changed methods of a python file, None if module level code changed
+        """
+        methods = set()
+        for side, source in (("old", lambda: _git(self.repo_root, "show", f"{commit}:{path}")),
+                             ("new", lambda: open(os.path.join(self.repo_root, path), encoding="utf-8").read())):
+            try:
+                ranges = function_ranges(source())
+            except (subprocess.CalledProcessError, OSError, SyntaxError):
+                return None
+            for lineno in lines[side]:
+                method = function_at(ranges, lineno)
+                if method is None:
+                    return None
+                methods.add(f"{path}::{method}")
+        return methods
+
+    @staticmethod
+    def _is_test_module(path):
+        """
+        Test modules and conftest.py files are mapped by their path, see _impacted
+        """
+        name = os.path.basename(path)
+        return name == "conftest.py" or name.startswith("test_") or name.endswith("_test.py")
+
+    def _impacted(self, item, test, changed, changed_methods):
+        path = self._nodeid_path(item)
+        for changed_path in changed:
+            if changed_path == path:
+                return True
+            if not changed_path.endswith(".py") and changed_path in test["files"]:
+                return True
+            # a conftest.py provides fixtures to the tests of its directory tree
+            if os.path.basename(changed_path) == "conftest.py" and \
+                    path.startswith(os.path.dirname(changed_path) + "/"):
+                return True
+            # data files are read by the tests of the directory owning the data directory, e.g. gateway/data/*.yaml
+            if "/data/" in changed_path and path.startswith(changed_path.split("/data/")[0] + "/"):
+                return True
+        for changed_path, methods in changed_methods.items():
+            if changed_path not in test["files"]:
+                continue
+            if methods is None or methods.intersection(test["methods"]):
+                return True
+        return False
+
+    def pytest_collection_modifyitems(self, session, config, items):
+        if self.mode != "select":
+            return
+        try:
+            with open(self.index_path, encoding="utf-8") as file:
+                index = json.load(file)
+            changed = self._changed_lines(index["commit"])
+        except (OSError, ValueError, KeyError, subprocess.CalledProcessError) as e:
+            self._summary = f"test impact: no usable index at {self.index_path} ({e}), running all tests"
+            return
+        full_run = [path for path in changed if path in self.full_run_files]
+        if full_run:
+            self._summary = f"test impact: {', '.join(full_run)} changed, running all tests"
+            return
+        test_root = f"{self._relpath(self.test_root)}/"
+        measured = tuple(f"{test_root}{package}/" for package in self.measured)
+        changed_methods = {}
+        read_files = {file for test in index["tests"].values() for file in test["files"]}
+        for path, lines in changed.items():
+            if not path.startswith(test_root):
+                continue
+            if not path.endswith(".py"):
+                if path not in read_files and "/data/" not in path:
+                    self._summary = f"test impact: no test is known to read {path}, running all tests"
+                    return
+                continue
+            if path.startswith(measured):
+                changed_methods[path] = None if lines is None else self._changed_methods(index["commit"], path, lines)
+            elif not self._is_test_module(path):
+                # shared code no index entry covers, the tests depending on it are unknown
+                self._summary = f"test impact: {path} is not mapped to tests, running all tests"
+                return
+        selected, deselected = [], []
+        for item in items:
+            test = index["tests"].get(item.nodeid)
+            if test is None or self._impacted(item, test, changed, changed_methods):
+                selected.append(item)
+            else:
+                deselected.append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        self._summary = f"test impact: {len(selected)} tests impacted by {len(changed)} changed files " \
+                        f"since {index['commit'][:8]}, {len(deselected)} deselected"
+
+    def pytest_report_collectionfinish(self, config):
+        if self._summary:
+            logger.info(self._summary)
+            return self._summary
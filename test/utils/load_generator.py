@@ -0,0 +1,208 @@
+import asyncio
+from collections import defaultdict
+from urllib.parse import urlparse
+from anyio.from_thread import start_blocking_portal
+from utils.action_timer import summarize
+from utils.log_util import logger
+
+
+class LoadReport:
+    """
+    Latencies in ms and errors of a load run by route
+    """
+
+    def __init__(self, elapsed, samples, errors):
+        self.elapsed = elapsed
+        self.samples = samples
+        self.errors = errors
+
+    def route(self, name):
+        """
+        :return: count, errors, throughput (successful requests per second) and latency percentiles of a route
+        """
+        samples = self.samples.get(name, [])
+        stats = summarize(samples) if samples else {"count": 0}
+        stats.update(errors=self.errors.get(name, 0), throughput=round(len(samples) / self.elapsed, 3))
+        return stats
+
+    def summary(self):
+        return {name: self.route(name) for name in sorted(set(self.samples) | set(self.errors))}
+
+    def violations(self, p99_ms=None, min_throughput=None, max_error_rate=0.0):
+        """
+        :return: a message per route exceeding the budget, empty if all routes are within it
+        """
+        messages = []
+        for name, stats in self.summary().items():
+            total = stats["count"] + stats["errors"]
+            if total and stats["errors"] / total > max_error_rate:
+                messages.append(f"{name}: {stats['errors']}/{total} requests failed")
+            if p99_ms is not None and stats["count"] and stats["p99"] > p99_ms:
+                messages.append(f"{name}: p99 {stats['p99']}ms exceeds {p99_ms}ms")
+            if min_throughput is not None and stats["throughput"] < min_throughput:
+                messages.append(f"{name}: throughput {stats['throughput']}/s is below {min_throughput}/s")
+        return messages
+
+
+class _Connection:
+    """
+    A keep-alive HTTP/1.1 connection to the proxy
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    async def request(self, method, path, headers):
+        head = "".join(f"{key}: {value}\r\n" for key, value in headers.items())
+        self.writer.write(f"{method} {path} HTTP/1.1\r\n{head}\r\n".encode("latin-1"))
+        await self.writer.drain()
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed by the proxy")
+        status = int(status_line.split()[1])
+        response_headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            response_headers[key.strip().lower()] = value.strip()
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                await self.reader.readexactly(size + 2)
+                if size == 0:
+                    break
+        elif method != "HEAD":
+            await self.reader.readexactly(int(response_headers.get("content-length", 0)))
+        return status, response_headers.get("connection", "").lower() != "close"
+
+    def close(self):
+        self.writer.close()
+
+
+class ProxyLoadGenerator:
+    """
+    Open-loop load on the Kong proxy (the :8000 listener): requests are sent at the target rate whether or not the
+    previous ones are answered, over up to `connections` keep-alive connections, and their latency is measured from
+    the time they were scheduled, so that a slow proxy shows up in the percentiles instead of lowering the rate
+
+    >>> report = ProxyLoadGenerator(proxy_url, rps=200, duration=10).run_sync({"kim": "/kim"})
+    >>> report.violations(p99_ms=50)
+    []
+    """
+
+    def __init__(self, proxy_url, rps=100, duration=10.0, connections=32, timeout=5.0, method="GET"):
+        parsed = urlparse(proxy_url)
+        self.host = parsed.hostname
+        self.port = parsed.port or 80
+        self.rps = rps
+        self.duration = duration
+        self.connections = connections
+        self.timeout = timeout
+        self.method = method
+
+    async def _send(self, name, path, headers, scheduled, idle, slots, samples, errors):
+        loop = asyncio.get_running_loop()
+        async with slots:
+            connection = idle.pop() if idle else None
+            try:
+                if connection is None:
+                    connection = _Connection(*await asyncio.wait_for(
+                        asyncio.open_connection(self.host, self.port), self.timeout))
+                status, keep_alive = await asyncio.wait_for(
+                    connection.request(self.method, path, headers), self.timeout)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as e:
+                logger.debug(f"{self.method} {path} failed: {e!r}")
+                errors[name] += 1
+                if connection:
+                    connection.close()
+                return
+            if keep_alive:
+                idle.append(connection)
+            else:
+                connection.close()
+        if status >= 400:
+            errors[name] += 1
+        else:
+            samples[name].append((loop.time() - scheduled) * 1000)
+
+    async def run(self, routes):
+        """
+        :param routes: request path by route name, or (path, headers) e.g. to route on the Host header,
+            requests are spread evenly across the routes
+        :return: a LoadReport
+        """
+        targets = []
+        for name, target in routes.items():
+            path, headers = (target, None) if isinstance(target, str) else target
+            targets.append((name, path, self._headers(headers)))
+        loop = asyncio.get_running_loop()
+        samples, errors = defaultdict(list), defaultdict(int)
+        idle, slots = [], asyncio.Semaphore(self.connections)
+        tasks = []
+        start = loop.time()
+        for i in range(int(self.rps * self.duration)):
+            scheduled = start + i / self.rps
+            delay = scheduled - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            name, path, headers = targets[i % len(targets)]
+            tasks.append(asyncio.create_task(
+                self._send(name, path, headers, scheduled, idle, slots, samples, errors)))
+        await asyncio.gather(*tasks)
+        elapsed = loop.time() - start
+        for connection in idle:
+            connection.close()
+        report = LoadReport(elapsed, dict(samples), dict(errors))
+        logger.info(f"load of {self.rps} rps for {self.duration}s: {report.summary()}")
+        return report
+
+    def _headers(self, extra_headers=None):
+        return {"Host": f"{self.host}:{self.port}", **(extra_headers or {})}
+
+    async def probe(self, path, headers=None):
+        """
+        :return: status of a single request on a new connection, None if the proxy can't be reached
+        """
+        try:
+            connection = _Connection(*await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout))
+        except (OSError, asyncio.TimeoutError):
+            return None
+        try:
+            status, _ = await asyncio.wait_for(connection.request(self.method, path, self._headers(headers)),
+                                               self.timeout)
+            return status
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError):
+            return None
+        finally:
+            connection.close()
+
+    async def wait_until_served(self, routes, timeout=30.0, interval=0.1):
+        """
+        Poll the routes until the proxy answers them with a success status, Kong rebuilds its router
+        asynchronously after an entity is created
+        :raise TimeoutError: if a route isn't served within timeout seconds
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        for name, target in routes.items():
+            path, headers = (target, None) if isinstance(target, str) else target
+            while True:
+                status = await self.probe(path, headers)
+                if status is not None and status < 400:
+                    break
+                if loop.time() > deadline:
+                    raise TimeoutError(f"route {name} is not served at {path} after {timeout}s, last status {status}")
+                await asyncio.sleep(interval)
+
+    def run_sync(self, routes):
+        """
+        run from synchronous code, the load runs on an event loop of its own thread as sync Playwright
+        keeps an event loop in the main thread
+        """
+        with start_blocking_portal() as portal:
+            portal.call(self.wait_until_served, routes)
+            return portal.call(self.run, routes)
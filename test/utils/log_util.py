@@ -1,48 +1,104 @@
 # coding=utf-8
+import atexit
+import json
 import logging
-import time
+import logging.handlers
 import os
+import queue
+import time
+
+log_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+log_time = time.strftime('%Y-%m-%d--%H_%M_%S')
 
-logname = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                       '{0}.log'.format(time.strftime('%Y-%m-%d--%H_%M_%S')))
+
+class JsonFormatter(logging.Formatter):
+    """
+    One json object per line, so that logs of parallel workers can be merged and queried by tools
+    """
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record),
+            "name": record.name,
+            "level": record.levelname,
+            "worker": os.getenv("PYTEST_XDIST_WORKER", "master"),
+            "message": record.getMessage()
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
 
 
 class LogUtil:
-    def __printconsole(self, level, message):
-        logger = logging.getLogger()
-        logger.setLevel(logging.DEBUG)
-        fh = logging.FileHandler(logname, 'a', encoding='utf-8')
-        fh.setLevel(logging.DEBUG)
-        ch = logging.StreamHandler()
-        ch.setLevel(logging.DEBUG)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    """
+    Logging is configured once per session: a QueueHandler puts records on a queue, and a QueueListener thread
+    writes them to the console and the log file, so logging calls don't do any I/O on the test thread
+    """
+    name = "UIAutoTest"
+
+    def __init__(self):
+        self._logger = logging.getLogger(self.name)
+        self._queue_handler = None
+        self._listener = None
+        self.logname = None
+
+    def configure(self, worker=None, json_format=False, level=logging.DEBUG):
+        """
+        :param worker: pytest-xdist worker id, each worker writes its own log file
+        :param json_format: write structured json lines instead of plain text
+        """
+        if self._listener:
+            return
+        suffix = f"-{worker}" if worker else ""
+        extension = "jsonl" if json_format else "log"
+        self.logname = os.path.join(log_dir, f"{log_time}{suffix}.{extension}")
+        if json_format:
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        fh = logging.FileHandler(self.logname, 'a', encoding='utf-8', delay=True)
+        fh.setLevel(level)
         fh.setFormatter(formatter)
+        ch = logging.StreamHandler()
+        ch.setLevel(level)
         ch.setFormatter(formatter)
-        logger.addHandler(fh)
-        logger.addHandler(ch)
-        if level == 'info':
-            logger.info(message)
-        elif level == 'debug':
-            logger.debug(message)
-        elif level == 'warning':
-            logger.warning(message)
-        elif level == 'error':
-            logger.error(message)
-        logger.removeHandler(ch)
-        logger.removeHandler(fh)
-        fh.close()
+        log_queue = queue.SimpleQueue()
+        self._queue_handler = logging.handlers.QueueHandler(log_queue)
+        self._logger.setLevel(level)
+        self._logger.addHandler(self._queue_handler)
+        self._listener = logging.handlers.QueueListener(log_queue, fh, ch, respect_handler_level=True)
+        self._listener.start()
+        atexit.register(self.shutdown)
+
+    def shutdown(self):
+        """
+        Flush the queued records and close the log file
+        """
+        if not self._listener:
+            return
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+        self._logger.removeHandler(self._queue_handler)
+        self._listener = None
+        self._queue_handler = None
+
+    def _log(self, level, message):
+        if not self._listener:
+            self.configure(worker=os.getenv("PYTEST_XDIST_WORKER"))
+        self._logger.log(level, message)
 
     def debug(self, message):
-        self.__printconsole('debug', message)
+        self._log(logging.DEBUG, message)
 
     def info(self, message):
-        self.__printconsole('info', message)
+        self._log(logging.INFO, message)
 
     def warning(self, message):
-        self.__printconsole('warning', message)
+        self._log(logging.WARNING, message)
 
     def error(self, message):
-        self.__printconsole('error', message)
+        self._log(logging.ERROR, message)
 
 
 logger = LogUtil()
@@ -0,0 +1,103 @@
+import asyncio
+import time
+from playwright.async_api import BrowserContext
+from pages.aio.page_gateway_service import GatewayService
+from utils.action_timer import summarize
+from utils.log_util import logger
+
+
+class FanOutResult:
+    def __init__(self, index, item, ok, elapsed_ms, error=None):
+        self.index = index
+        self.item = item
+        self.ok = ok
+        self.elapsed_ms = elapsed_ms
+        self.error = error
+
+    def __repr__(self):
+        return f"FanOutResult(index={self.index}, ok={self.ok}, elapsed_ms={round(self.elapsed_ms, 3)}, " \
+               f"error={self.error!r})"
+
+
+class PageFanOut:
+    """
+    Drive an async page-object action on several tabs of one BrowserContext concurrently.
+
+    Items are pulled by the tabs from a bounded work queue, it is fed from any iterable, e.g. the list read from a
+    YAML data file or a generator, so generated data is never materialized in full. Each item gets a FanOutResult
+    with its success or failure and the latency of the action.
+    """
+
+    def __init__(self, context: BrowserContext, tabs=4):
+        self._context = context
+        self.tabs = tabs
+
+    async def run(self, items, action):
+        """
+        :param items: iterable of work items
+        :param action: coroutine function action(page, item), the item fails if it raises or returns a response
+            that is not ok
+        :return: results in the order of items
+        """
+        queue = asyncio.Queue(maxsize=self.tabs * 2)
+        results = []
+
+        async def produce():
+            try:
+                for index, item in enumerate(items):
+                    await queue.put((index, item))
+            finally:
+                # one stop signal per tab, also when the iterable fails
+                for _ in range(self.tabs):
+                    await queue.put(None)
+
+        async def consume():
+            page = await self._context.new_page()
+            try:
+                while True:
+                    work = await queue.get()
+                    if work is None:
+                        return
+                    results.append(await self._run_item(page, action, *work))
+            finally:
+                await page.close()
+
+        await asyncio.gather(produce(), *(consume() for _ in range(self.tabs)))
+        results.sort(key=lambda result: result.index)
+        return results
+
+    @staticmethod
+    async def _run_item(page, action, index, item):
+        start = time.perf_counter()
+        try:
+            response = await action(page, item)
+        except Exception as e:
+            logger.warning(f"fan-out item {index} failed: {e}")
+            return FanOutResult(index, item, False, (time.perf_counter() - start) * 1000, str(e))
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if response is not None and not response.ok:
+            error = f"{response.status} {await response.text()}"
+            return FanOutResult(index, item, False, elapsed_ms, error)
+        return FanOutResult(index, item, True, elapsed_ms)
+
+    async def new_gateway_services(self, items, base_url, workspace_name="default", ledger=None):
+        """
+        Create a gateway service through the form for each item, items are kwargs of GatewayService.new_gateway_service
+        :param ledger: EntityLedger recording the created gateway services
+        """
+        async def new_gateway_service(page, item):
+            gateway_service = GatewayService(page, ledger=ledger)
+            await gateway_service.goto_gateway_service(base_url, workspace_name)
+            return await gateway_service.new_gateway_service(item)
+
+        return await self.run(items, new_gateway_service)
+
+    @staticmethod
+    def summary(results):
+        latencies = [result.elapsed_ms for result in results]
+        return {
+            "total": len(results),
+            "succeeded": sum(1 for result in results if result.ok),
+            "failed": sum(1 for result in results if not result.ok),
+            "latency": summarize(latencies) if latencies else None
+        }
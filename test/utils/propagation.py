@@ -0,0 +1,55 @@
+import time
+from requests import RequestException, Session
+from utils.action_timer import action_timer
+
+
+class PropagationProbe:
+    """
+    Time for a change of Kong configuration to reach the proxy: from the submit of a form, or an Admin API call,
+    to the first response of the proxy reflecting it. Kong rebuilds its router in the background, the probe polls the
+    proxy until a new route is served, an updated route answers as expected or a deleted route answers 404
+    """
+
+    def __init__(self, proxy_url, timeout=30.0, interval=0.02):
+        self.proxy_url = proxy_url.rstrip("/")
+        self.timeout = timeout
+        self.interval = interval
+        self._session = Session()
+
+    def _get(self, path):
+        try:
+            return self._session.get(f"{self.proxy_url}{path}", timeout=self.timeout)
+        except RequestException:
+            return None
+
+    def wait_for(self, path, check, since, action):
+        """
+        :param check: check(response) is true once the change is served, response is None if the proxy is unreachable
+        :param since: time.perf_counter() of the change
+        :param action: name of the change, the latency is recorded by action_timer as Propagation.<action>
+        :return: latency in ms from since to the first response passing check
+        :raise TimeoutError: if no response passes check within the timeout
+        """
+        deadline = since + self.timeout
+        while True:
+            response = self._get(path)
+            now = time.perf_counter()
+            if check(response):
+                latency = (now - since) * 1000
+                action_timer.record(f"Propagation.{action}", latency)
+                return latency
+            if now > deadline:
+                status = response.status_code if response is not None else None
+                raise TimeoutError(f"{action} of {path} not served after {self.timeout}s, last status {status}")
+            time.sleep(self.interval)
+
+    def wait_until_served(self, path, since, action="create"):
+        return self.wait_for(path, lambda response: response is not None and response.ok, since, action)
+
+    def wait_until_gone(self, path, since, action="delete"):
+        # Kong answers 404 "no Route matched" once the route is removed from its router
+        return self.wait_for(path, lambda response: response is not None and response.status_code == 404,
+                             since, action)
+
+    def close(self):
+        self._session.close()
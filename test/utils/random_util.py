@@ -1,3 +1,5 @@
+import itertools
+import os
 import string
 import uuid
 import random
@@ -6,14 +8,45 @@ import time
 
 
 class RandomUtil:
+    """
+    Random test data, all values are drawn from one generator so that a run is reproduced by its seed,
+    see RandomUtil.seed
+    """
+    _random = random.Random()
+    _seed = None
+    _names = itertools.count()
+
+    @staticmethod
+    def seed(seed, *streams):
+        """
+        Reseed the generator, streams (e.g. the test nodeid) derive independent sequences from the same seed
+        """
+        RandomUtil._seed = seed
+        RandomUtil._random.seed("/".join(str(part) for part in (seed, *streams)))
+
+    @staticmethod
+    def rng():
+        """
+        :return: the seeded generator of RandomUtil, for helpers drawing their own values from the run's sequence
+        """
+        return RandomUtil._random
+
+    @staticmethod
+    def unique_name(prefix="kim"):
+        """
+        :return: a name unique within the run, across pytest-xdist workers, e.g. kim-1a2b3c-gw0-7
+        """
+        token = f"{RandomUtil._seed:x}"[-6:] if isinstance(RandomUtil._seed, int) else "0"
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        return f"{prefix}-{token}-{worker}-{next(RandomUtil._names)}"
 
     @staticmethod
     def true_or_false():
-        return random.choice([True, False])
+        return RandomUtil._random.random() < 0.5
 
     @staticmethod
     def _uuid():
-        return uuid.uuid1()
+        return uuid.UUID(int=RandomUtil._random.getrandbits(128), version=4)
 
     @staticmethod
     def str_uuid():
@@ -21,7 +54,7 @@ class RandomUtil:
 
     @staticmethod
     def string(length=10):
-        return ''.join(random.choice(string.ascii_letters) for _ in range(length))
+        return ''.join(RandomUtil._random.choices(string.ascii_letters, k=length))
 
     @staticmethod
     def str_double(x=5, y=5):
@@ -29,18 +62,18 @@ class RandomUtil:
 
     @staticmethod
     def str_number(length=3):
-        return str(random.randint(1, 9)) + ''.join(str(random.randint(0, 9)) for _ in range(length - 1))
+        return str(RandomUtil._random.randint(10 ** (length - 1), 10 ** length - 1))
 
     @staticmethod
     def integer(start, end=None):
         end = end or start * 10 - 1
-        return random.randint(start, end)
+        return RandomUtil._random.randint(start, end)
 
     @staticmethod
     def timestamp():
         end_time = datetime.now() + timedelta(days=365)
         start_time = datetime.now() + timedelta(days=-3650)
-        timestamp = random.randint(int(time.mktime(start_time.timetuple())), int(time.mktime(end_time.timetuple())))
+        timestamp = RandomUtil._random.randint(int(time.mktime(start_time.timetuple())), int(time.mktime(end_time.timetuple())))
         return timestamp
 
     @staticmethod
@@ -80,7 +113,7 @@ class RandomUtil:
         """
         # index of replacement
         start_position = [0, 3, 6]
-        selected_start_position = random.choice(start_position)
+        selected_start_position = RandomUtil._random.choice(start_position)
         full_time = datetime.fromtimestamp(RandomUtil.timestamp()).strftime("%H:%M:%S")
         # replace 2 chars started from index
         return full_time[:selected_start_position] + '00' + full_time[selected_start_position + 2:]
@@ -95,11 +128,11 @@ class RandomUtil:
 
     @staticmethod
     def str_printable(length: int = 10):
-        return ''.join(random.choice(string.printable) for _ in range(length))
+        return ''.join(RandomUtil._random.choices(string.printable, k=length))
 
     @staticmethod
     def str_punctuation(length: int = 10):
-        return ''.join(random.choice(string.punctuation) for _ in range(length))
+        return ''.join(RandomUtil._random.choices(string.punctuation, k=length))
 
     @staticmethod
     def i18ntext_dict(length: int = 10):
@@ -111,7 +144,7 @@ class RandomUtil:
         return conjunction.join(
             [prefix,
              datetime.now().strftime("%Y%m%d%H%M%S"),
-             "".join(random.choices(string.ascii_letters, k=5))])
+             "".join(RandomUtil._random.choices(string.ascii_letters, k=5))])
 
 
 if __name__ == "__main__":
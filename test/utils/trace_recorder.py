@@ -0,0 +1,74 @@
+import os
+import re
+import shutil
+import time
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from playwright.sync_api import BrowserContext
+from utils.log_util import logger
+
+
+class TraceRecorder:
+    """
+    Record a Playwright trace chunk per test instead of one trace.zip per run
+
+    Retention policies:
+        failed: keep the chunks of failed tests only, chunks of passed tests are discarded without being serialized
+        all: keep the chunks of all tests
+        off: no tracing at all
+
+    Playwright serializes a chunk when it is stopped, the recorder writes it to a local staging directory and
+    moves it into the run-scoped directory on a background thread, open the chunks in https://trace.playwright.dev/
+    """
+    policies = ("failed", "all", "off")
+
+    def __init__(self, root_dir, policy="failed", run_id=None):
+        if policy not in self.policies:
+            raise ValueError(f"unknown trace retention policy {policy}, expected one of {self.policies}")
+        self.policy = policy
+        self.run_dir = os.path.join(root_dir, "traces", run_id or time.strftime('%Y-%m-%d--%H_%M_%S'))
+        self._staging_dir = None
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trace-writer")
+        self._pending = []
+
+    @property
+    def enabled(self):
+        return self.policy != "off"
+
+    def start(self, context: BrowserContext):
+        if self.enabled:
+            context.tracing.start(screenshots=True, snapshots=True, sources=True)
+
+    def start_chunk(self, context: BrowserContext, title):
+        if self.enabled:
+            context.tracing.start_chunk(title=title)
+
+    def stop_chunk(self, context: BrowserContext, nodeid, failed):
+        if not self.enabled:
+            return
+        if self.policy == "failed" and not failed:
+            context.tracing.stop_chunk()
+            return
+        if self._staging_dir is None:
+            self._staging_dir = tempfile.mkdtemp(prefix="trace-")
+        file_name = re.sub(r"[^\w.-]+", "_", nodeid) + ".zip"
+        staging = os.path.join(self._staging_dir, file_name)
+        context.tracing.stop_chunk(path=staging)
+        self._pending.append(self._writer.submit(self._move, staging, os.path.join(self.run_dir, file_name)))
+
+    def stop(self, context: BrowserContext):
+        if self.enabled:
+            context.tracing.stop()
+
+    @staticmethod
+    def _move(staging, target):
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.move(staging, target)
+        logger.debug(f"trace saved to {target}")
+
+    def close(self):
+        for future in self._pending:
+            future.result()
+        self._writer.shutdown()
+        if self._staging_dir:
+            shutil.rmtree(self._staging_dir, ignore_errors=True)
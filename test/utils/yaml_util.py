@@ -1,10 +1,104 @@
+import hashlib
+import os
+import pickle
+import threading
 import yaml
+from utils.log_util import logger
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 
 class YamlUtil:
+    """
+    Test data loader, YAML files are parsed with libyaml when available and the parsed data is cached on disk by
+    file path, keyed by modification time and size, and by content hash when only the modification time changed.
+    Records are validated once per process and shared by all the tests reading the same file
+    """
+    cache_dir = os.getenv("TEST_DATA_CACHE") or os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), ".test_data_cache")
+    _records = {}
+    _lock = threading.Lock()
+    # absolute paths of the files read while it is a set, the test impact index maps tests to the data they read
+    read_files = None
+
+    @staticmethod
+    def _record_read(file_path):
+        if YamlUtil.read_files is not None:
+            YamlUtil.read_files.add(file_path)
 
     @staticmethod
     def read_yaml(file_path):
-        with open(file_path, 'r') as file:
-            data = yaml.safe_load(file)
+        file_path = os.path.abspath(file_path)
+        YamlUtil._record_read(file_path)
+        return YamlUtil._load(file_path)
+
+    @staticmethod
+    def read_records(file_path, model):
+        """
+        :param model: class of the records, model.from_dict validates an item of the file and builds its record
+        :return: a tuple of records, one per item of the YAML list in file_path
+        :raise ValueError: if an item is invalid, with its index in the file
+        """
+        file_path = os.path.abspath(file_path)
+        YamlUtil._record_read(file_path)
+        stat = os.stat(file_path)
+        key = (file_path, model, stat.st_mtime_ns, stat.st_size)
+        with YamlUtil._lock:
+            records = YamlUtil._records.get(key)
+        if records is not None:
+            return records
+        data = YamlUtil._load(file_path)
+        if not isinstance(data, list):
+            raise ValueError(f"{file_path}: expected a list of {model.__name__}")
+        built = []
+        for index, item in enumerate(data):
+            try:
+                built.append(model.from_dict(item))
+            except ValueError as e:
+                raise ValueError(f"{file_path}[{index}]: {e}") from None
+        records = tuple(built)
+        with YamlUtil._lock:
+            YamlUtil._records[key] = records
+        return records
+
+    @staticmethod
+    def _cache_path(file_path):
+        return os.path.join(YamlUtil.cache_dir, hashlib.sha1(file_path.encode("utf-8")).hexdigest() + ".pickle")
+
+    @staticmethod
+    def _load(file_path):
+        cache_path = YamlUtil._cache_path(file_path)
+        stat = os.stat(file_path)
+        cached = None
+        try:
+            with open(cache_path, "rb") as file:
+                cached = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            pass
+        if cached and (cached["mtime_ns"], cached["size"]) == (stat.st_mtime_ns, stat.st_size):
+            return cached["data"]
+        with open(file_path, "rb") as file:
+            content = file.read()
+        digest = hashlib.sha256(content).hexdigest()
+        if cached and cached["sha256"] == digest:
+            data = cached["data"]
+        else:
+            data = yaml.load(content, Loader=SafeLoader)
+        YamlUtil._save(cache_path, {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest,
+                                    "data": data})
         return data
+
+    @staticmethod
+    def _save(cache_path, entry):
+        try:
+            os.makedirs(YamlUtil.cache_dir, exist_ok=True)
+            # several pytest-xdist workers may write the same entry
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as file:
+                pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"failed to cache test data to {cache_path}: {e}")